@@ -1,5 +1,7 @@
 # flake8: noqa
 from .linguin import *
+from .async_linguin import *
+from .pool import *
 from .exceptions import *
 
 __version__ = (2, 0, 0)
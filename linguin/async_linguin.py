@@ -0,0 +1,141 @@
+import importlib.util
+from .linguin import Linguin, EMPTY_TEXT_MESSAGES, EMPTY_BULK_MESSAGE
+from .linguin_response import LinguinResponse
+from .exceptions import LinguinInputError
+from .transport import create_transport
+
+
+class AsyncLinguin:
+    """Asyncio client class for Linguin API
+
+    Covers the same endpoints as Linguin and returns the same LinguinResponse
+    and LinguinError objects. At most max_concurrency requests are in flight
+    at any time, further calls wait for a free slot.
+
+    Requires aiohttp (pip install linguin[async]) for the default transport,
+    which is imported on the first request.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 100
+
+    def __init__(self, api_key, raise_on_error=False, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 pool_size=None, timeout=Linguin.DEFAULT_TIMEOUT, base_uri=Linguin.BASE_URI, transport='aiohttp'):
+        '''
+        Parameters:
+            api_key (string): your Linguin API key
+            raise_on_error (bool): raise LinguinErrors instead of returning them
+            max_concurrency (int): maximum number of requests in flight
+            pool_size (int): maximum number of connections kept open, defaults to max_concurrency
+            timeout (float or tuple): connect and read timeout in seconds, e.g. (3.05, 30)
+            base_uri (string): API host, e.g. a local test server
+            transport (string or AsyncTransport): 'aiohttp' or an AsyncTransport instance, see linguin.transport
+        '''
+        if transport == 'aiohttp' and importlib.util.find_spec('aiohttp') is None:
+            raise ImportError('AsyncLinguin requires aiohttp, install it with: pip install linguin[async]')
+
+        self.api_key = api_key
+        self.headers = {
+            'Authorization': 'Bearer ' + self.api_key
+        }
+        self.raise_on_error = raise_on_error
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size or max_concurrency
+        self.timeout = timeout
+        self.base_uri = base_uri
+        self._transport_option = transport
+        self._transport = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        '''Closes all pooled connections'''
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
+
+    async def detect_language(self, text, raise_on_error=False):
+        '''Returns detection response from the server, see Linguin.detect_language'''
+        return await self._detect('language', text, raise_on_error)
+
+    async def detect_profanity(self, text, raise_on_error=False):
+        '''Returns detection response from the server, see Linguin.detect_profanity'''
+        return await self._detect('profanity', text, raise_on_error)
+
+    async def bulk_detect_language(self, texts, raise_on_error=False):
+        '''Returns bulk detection response from the server, see Linguin.bulk_detect_language'''
+        return await self._bulk_detect('language', texts, raise_on_error)
+
+    async def bulk_detect_profanity(self, texts, raise_on_error=False):
+        '''Returns bulk detection response from the server, see Linguin.bulk_detect_profanity'''
+        return await self._bulk_detect('profanity', texts, raise_on_error)
+
+    async def status(self, raise_on_error=False):
+        '''Returns api usage status from the server, see Linguin.status'''
+        response = await self._request('GET', 'status')
+
+        return self._finish(response, raise_on_error)
+
+    @classmethod
+    async def languages(cls):
+        '''Returns list of supported languages'''
+        transport = create_transport('aiohttp', 1)
+
+        try:
+            response = await transport.request('GET', Linguin._url('languages'), timeout=Linguin.DEFAULT_TIMEOUT)
+        finally:
+            await transport.close()
+
+        return response.json()
+
+    async def _detect(self, kind, text, raise_on_error):
+        text = Linguin._sanitize(text)
+
+        if not text:
+            error = LinguinInputError(400, EMPTY_TEXT_MESSAGES[kind])
+            return self._finish(LinguinResponse(error=error), raise_on_error)
+
+        response = await self._request('POST', 'detect/' + kind, {'q': text})
+
+        return self._finish(response, raise_on_error)
+
+    async def _bulk_detect(self, kind, texts, raise_on_error):
+        texts = list(map(Linguin._sanitize, texts))
+
+        if not all(texts):
+            error = LinguinInputError(400, EMPTY_BULK_MESSAGE)
+            return self._finish(LinguinResponse(error=error), raise_on_error)
+
+        response = await self._request('POST', 'bulk_detect/' + kind, [('q[]', text) for text in texts])
+
+        return self._finish(response, raise_on_error)
+
+    async def _request(self, method, path, payload=None):
+        '''Sends a request once a concurrency slot is free and wraps the result'''
+        if self._semaphore is None:
+            import asyncio
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            response = await self._get_transport().request(method, self._url(path), data=payload, headers=self.headers, timeout=self.timeout)
+
+        return LinguinResponse(response)
+
+    def _url(self, path):
+        return '{base}/{version}/{path}'.format(base=self.base_uri, version=Linguin.API_VERSION, path=path)
+
+    def _get_transport(self):
+        if self._transport is None:
+            self._transport = create_transport(self._transport_option, self.pool_size)
+
+        return self._transport
+
+    def _finish(self, response, raise_on_error):
+        if raise_on_error or self.raise_on_error:
+            response.raise_on_error()
+
+        return response
@@ -0,0 +1,93 @@
+"""Aggregation of single calls into bulk calls"""
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Collects items submitted from any thread and flushes them in batches
+
+    A batch is flushed once it holds max_size items or max_wait seconds after
+    its first item arrived, whichever comes first. flush receives the list of
+    items and returns a list of results in the same order, each submitter's
+    future resolves with its own result. Up to max_in_flight batches are
+    flushed concurrently.
+    """
+
+    def __init__(self, flush, max_size, max_wait, max_in_flight=1):
+        self.flush = flush
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.max_in_flight = max_in_flight
+        self._queue = queue.Queue()
+        self._thread = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, item):
+        '''Queues item and returns a Future of its result'''
+        future = Future()
+
+        with self._lock:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix='linguin-batch')
+                self._thread = threading.Thread(target=self._collect, name='linguin-batcher', daemon=True)
+                self._thread.start()
+
+            self._queue.put((item, future))
+
+        return future
+
+    def close(self):
+        '''Flushes queued items and stops the background threads'''
+        with self._lock:
+            if self._thread is None:
+                return
+
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._executor.shutdown(wait=True)
+            self._thread = None
+            self._executor = None
+
+    def _collect(self):
+        stopping = False
+
+        while not stopping:
+            first = self._queue.get()
+
+            if first is _STOP:
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_size:
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+                if entry is _STOP:
+                    stopping = True
+                    break
+
+                batch.append(entry)
+
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch):
+        futures = [future for _, future in batch]
+
+        try:
+            results = self.flush([item for item, _ in batch])
+        except BaseException as error:
+            for future in futures:
+                future.set_exception(error)
+            return
+
+        for future, result in zip(futures, results):
+            future.set_result(result)
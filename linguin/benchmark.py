@@ -0,0 +1,156 @@
+"""Throughput and latency benchmark of the client against the local mock server
+
+Run it with: python -m linguin.benchmark --texts 2000 --latency 0.005
+and measure the import cost with: python -m linguin.benchmark --imports
+"""
+import argparse
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .linguin import Linguin
+from .mock_server import MockLinguinServer
+
+MODES = ('single', 'bulk', 'concurrent')
+SAMPLE_TEXTS = ('Where is the train station?', 'Wo ist der Bahnhof?', '駅はどこですか', '역이 어디에 있어요?', 'you moron')
+IMPORTS = {
+    'linguin': 'import linguin',
+    'requests transport': "import linguin; linguin.Linguin('key', transport='requests').transport",
+    'urllib transport': "import linguin; linguin.Linguin('key', transport='urllib').transport"
+}
+IMPORT_PROBE = """
+import resource, time
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+rss = rss_kb()
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started, rss_kb() - rss)
+"""
+
+
+def percentile(values, share):
+    '''Returns the value below which share of the sorted values fall'''
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def run(mode, texts, base_uri, concurrency=8, batch_size=100, **client_options):
+    '''Runs one benchmark mode and returns its measurements
+
+    Returns:
+        dict with mode, requests, texts, seconds, requests_per_second, texts_per_second,
+        p50 and p99 latency per call in seconds
+    '''
+    latencies = []
+
+    def timed(call, *args):
+        started = time.perf_counter()
+        call(*args).raise_on_error()
+        latencies.append(time.perf_counter() - started)
+
+    with Linguin('benchmark', base_uri=base_uri, pool_size=concurrency, max_workers=concurrency, **client_options) as linguin:
+        started = time.perf_counter()
+
+        if mode == 'single':
+            for text in texts:
+                timed(linguin.detect_language, text)
+        elif mode == 'bulk':
+            for start in range(0, len(texts), batch_size):
+                timed(linguin.bulk_detect_language, texts[start:start + batch_size])
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(lambda text: timed(linguin.detect_language, text), texts))
+
+        seconds = time.perf_counter() - started
+
+    latencies.sort()
+
+    return {
+        'mode': mode,
+        'requests': len(latencies),
+        'texts': len(texts),
+        'seconds': seconds,
+        'requests_per_second': len(latencies) / seconds,
+        'texts_per_second': len(texts) / seconds,
+        'p50': percentile(latencies, 0.5),
+        'p99': percentile(latencies, 0.99)
+    }
+
+
+def measure_import(name, statement, repeat=5):
+    '''Runs statement in repeat fresh interpreters and returns its fastest run
+
+    Returns:
+        dict with name, seconds and rss_kb, the resident memory added by the statement
+        (peak memory where /proc is missing, resource is not available on Windows)
+    '''
+    runs = []
+
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', IMPORT_PROBE.format(statement=statement)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        runs.append((float(output[0]), int(output[1])))
+
+    seconds, rss_kb = min(runs)
+
+    return {'name': name, 'seconds': seconds, 'rss_kb': rss_kb}
+
+
+def report_imports(results):
+    '''Returns the import measurements formatted as a table'''
+    lines = ['{:<24}{:>12}{:>12}'.format('import', 'ms', 'RSS KB')]
+
+    for result in results:
+        lines.append('{name:<24}{ms:>12.1f}{rss_kb:>12}'.format(ms=result['seconds'] * 1000, **result))
+
+    return '\n'.join(lines)
+
+
+def report(results):
+    '''Returns the measurements formatted as a table'''
+    lines = ['{:<12}{:>10}{:>10}{:>12}{:>12}{:>10}{:>10}'.format('mode', 'requests', 'texts', 'req/s', 'texts/s', 'p50 ms', 'p99 ms')]
+
+    for result in results:
+        lines.append('{mode:<12}{requests:>10}{texts:>10}{requests_per_second:>12.1f}{texts_per_second:>12.1f}{p50:>10.2f}{p99:>10.2f}'.format(
+            **dict(result, p50=result['p50'] * 1000, p99=result['p99'] * 1000)
+        ))
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Linguin client against a local mock server')
+    parser.add_argument('--texts', type=int, default=2000, help='number of texts per mode')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--concurrency', type=int, default=8, help='threads and connections in concurrent mode')
+    parser.add_argument('--batch-size', type=int, default=100, help='texts per call in bulk mode')
+    parser.add_argument('--latency', type=float, default=0.002, help='server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.001, help='maximum random server latency added in seconds')
+    parser.add_argument('--transport', choices=('requests', 'urllib'), help='HTTP transport of the client')
+    parser.add_argument('--imports', action='store_true', help='measure import time and memory instead')
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        print(report_imports([measure_import(name, statement) for name, statement in IMPORTS.items()]))
+        return
+
+    # distinct texts, so the client's deduplication and coalescing don't skew the numbers
+    texts = ['{text} {index}'.format(text=SAMPLE_TEXTS[index % len(SAMPLE_TEXTS)], index=index) for index in range(args.texts)]
+
+    with MockLinguinServer(latency=args.latency, jitter=args.jitter, max_bulk_size=max(1000, args.batch_size)) as server:
+        results = [run(mode, texts, server.base_uri, args.concurrency, args.batch_size, transport=args.transport) for mode in args.modes]
+
+    print(report(results))
+
+
+if __name__ == '__main__':
+    main()
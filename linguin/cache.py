@@ -0,0 +1,198 @@
+"""Client-side caches for detection results
+
+A cache maps keys built by cache_key() to the per-text result of an endpoint,
+i.e. the list of language candidates or the profanity score. Every cache
+implements get_many(keys) -> dict and set_many(dict) and is safe to share
+between threads.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# seconds between deletions of expired SQLiteCache entries, expired entries are never returned in between
+PURGE_INTERVAL = 60.0
+_sha256 = None
+
+
+def cache_key(version, kind, text):
+    '''Returns the cache key of a sanitized text for an endpoint kind and API version'''
+    global _sha256
+
+    if _sha256 is None:
+        from hashlib import sha256 as _sha256
+
+    digest = _sha256(text.encode('utf-8')).hexdigest()
+
+    return '{version}:{kind}:{digest}'.format(version=version, kind=kind, digest=digest)
+
+
+class MemoryCache:
+    """In-memory cache with LRU and optional TTL eviction
+
+    Attributes:
+        - max_size: int - maximum number of entries kept
+        - ttl: float - seconds after which an entry expires, None to keep entries until evicted
+        - hits: int - number of successful lookups
+        - misses: int - number of failed lookups
+    """
+
+    def __init__(self, max_size=10000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_many(self, keys):
+        '''Returns a dict of the keys found in the cache and their values'''
+        found = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+
+                if entry is None or (entry[1] is not None and entry[1] <= now):
+                    self._entries.pop(key, None)
+                    self.misses += 1
+                    continue
+
+                self._entries.move_to_end(key)
+                found[key] = entry[0]
+                self.hits += 1
+
+        return found
+
+    def set_many(self, items):
+        '''Stores values by key, evicting the least recently used entries'''
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """SQLite backed cache that survives restarts, with LRU and optional TTL eviction
+
+    Attributes:
+        - path: str - database file, created if missing
+        - max_size: int - maximum number of entries kept
+        - ttl: float - seconds after which an entry expires, None to keep entries until evicted
+        - hits: int - number of successful lookups
+        - misses: int - number of failed lookups
+    """
+
+    def __init__(self, path, max_size=1000000, ttl=None):
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        import sqlite3
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS linguin_cache '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS linguin_cache_used_at ON linguin_cache (used_at)')
+        self._connection.commit()
+        # tracked so that writes below max_size don't touch the rest of the table
+        self._size = self._connection.execute('SELECT COUNT(*) FROM linguin_cache').fetchone()[0]
+        self._purged_at = float('-inf')
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM linguin_cache').fetchone()[0]
+
+    def get_many(self, keys):
+        '''Returns a dict of the keys found in the cache and their values'''
+        import json
+
+        keys = list(keys)
+        found = {}
+        now = time.time()
+        oldest = float('-inf') if self.ttl is None else now - self.ttl
+
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self._connection.execute(
+                    'SELECT key, value FROM linguin_cache WHERE stored_at > ? AND key IN ({})'.format(','.join('?' * len(batch))),
+                    [oldest] + batch
+                )
+                found.update((key, json.loads(value)) for key, value in rows)
+
+            self._connection.executemany('UPDATE linguin_cache SET used_at = ? WHERE key = ?', [(now, key) for key in found])
+            self._connection.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def set_many(self, items):
+        '''Stores values by key, evicting the least recently used entries beyond max_size
+
+        Expired entries are deleted at most every PURGE_INTERVAL seconds.
+        '''
+        import json
+
+        now = time.time()
+        rows = [(key, json.dumps(value), now, now) for key, value in items.items()]
+
+        with self._lock:
+            self._size += len(rows) - self._count_stored(list(items))
+            self._connection.executemany('INSERT OR REPLACE INTO linguin_cache VALUES (?, ?, ?, ?)', rows)
+
+            if self.ttl is not None and now - self._purged_at >= PURGE_INTERVAL:
+                self._purge_expired(now)
+
+            if self._size > self.max_size:
+                self._connection.execute(
+                    'DELETE FROM linguin_cache WHERE key IN (SELECT key FROM linguin_cache ORDER BY used_at LIMIT ?)',
+                    (self._size - self.max_size,)
+                )
+                self._size = self.max_size
+
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM linguin_cache')
+            self._connection.commit()
+            self._size = 0
+
+    def _count_stored(self, keys):
+        '''Returns how many of keys are stored already'''
+        count = 0
+
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            count += self._connection.execute(
+                'SELECT COUNT(*) FROM linguin_cache WHERE key IN ({})'.format(','.join('?' * len(batch))), batch
+            ).fetchone()[0]
+
+        return count
+
+    def _purge_expired(self, now):
+        '''Deletes expired entries and recounts the table, which other processes may share'''
+        self._connection.execute('DELETE FROM linguin_cache WHERE stored_at <= ?', (now - self.ttl,))
+        self._size = self._connection.execute('SELECT COUNT(*) FROM linguin_cache').fetchone()[0]
+        self._purged_at = now
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
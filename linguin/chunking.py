@@ -0,0 +1,48 @@
+"""Splitting of bulk inputs into request sized chunks"""
+from urllib.parse import quote_plus
+
+# every text is sent as 'q[]=<text>&', this is the size of the encoded key and separators
+FORM_FIELD_OVERHEAD = len('q%5B%5D=&')
+# every text is sent as '"<text>", ' in a JSON list
+JSON_ITEM_OVERHEAD = len(', ')
+
+
+def form_size(text):
+    '''Returns the bytes text takes in a form body, non-ASCII characters are percent-escaped'''
+    return len(quote_plus(text)) + FORM_FIELD_OVERHEAD
+
+
+def json_size(text):
+    '''Returns the bytes text takes in a UTF-8 JSON body'''
+    import json
+
+    return len(json.dumps(text, ensure_ascii=False).encode('utf-8')) + JSON_ITEM_OVERHEAD
+
+
+def chunk_texts(texts, max_size, max_bytes, size=form_size):
+    '''Yields lists of texts bounded by item count and encoded payload bytes
+
+    A single text larger than max_bytes is yielded as a chunk of its own.
+
+    Parameters:
+        texts (iterable of strings): sanitized texts
+        max_size (int): maximum number of texts per chunk
+        max_bytes (int): maximum encoded payload size per chunk, before compression
+        size (function): returns the encoded size of a text, form_size or json_size
+    '''
+    chunk = []
+    chunk_bytes = 0
+
+    for text in texts:
+        text_bytes = size(text)
+
+        if chunk and (len(chunk) >= max_size or chunk_bytes + text_bytes > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+
+        chunk.append(text)
+        chunk_bytes += text_bytes
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,186 @@
+"""Command line batch processor
+
+    linguin detect language --in data.jsonl --field text --out results.jsonl
+
+Input is read as a stream and sent in concurrent bulk requests, output is
+written in input order as JSON lines. Progress is checkpointed next to the
+output file, a killed job started again with the same arguments resumes
+where it stopped without sending finished texts again.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from itertools import islice
+from .linguin import Linguin
+from .exceptions import LinguinError
+from .retry import RetryPolicy
+
+FORMATS = ('jsonl', 'csv', 'text')
+
+
+def read_records(file, format, field):
+    '''Yields (record, text) tuples, records are dicts written back with the result'''
+    if format == 'csv':
+        for row in csv.DictReader(file):
+            yield row, row.get(field)
+    elif format == 'jsonl':
+        for number, line in enumerate(file, 1):
+            if line.strip():
+                record = parse_record(number, line)
+                yield record, record.get(field)
+    else:
+        for line in file:
+            text = line.rstrip('\r\n')
+            yield {field: text}, text
+
+
+def parse_record(number, line):
+    '''Returns the JSON object of an input line, raising ValueError with the line number for anything else'''
+    try:
+        record = json.loads(line)
+    except ValueError as error:
+        raise ValueError('line {number} is not valid JSON ({error})'.format(number=number, error=error)) from error
+
+    if not isinstance(record, dict):
+        raise ValueError('line {number} is not a JSON object'.format(number=number))
+
+    return record
+
+
+class Checkpoint:
+    """Number of input records done and bytes of output written for them, stored in path"""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        self.offset = 0
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        self.records = stored['records']
+        self.offset = stored['offset']
+        return True
+
+    def save(self, output):
+        output.flush()
+        os.fsync(output.fileno())
+        self.offset = output.tell()
+        temporary = self.path + '.tmp'
+
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'records': self.records, 'offset': self.offset}, file)
+
+        os.replace(temporary, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def detect(linguin, kind, records, output, checkpoint, checkpoint_every, result_field, max_in_flight=None):
+    '''Writes every record with its result to output, in input order'''
+    pending = deque()
+
+    def texts():
+        for record, text in records:
+            text = '' if text is None else str(text).strip()
+            pending.append((record, text))
+
+            if text:
+                yield text
+
+    def write(record, result):
+        record[result_field] = result
+        output.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        checkpoint.records += 1
+
+        if checkpoint.records % checkpoint_every == 0:
+            checkpoint.save(output)
+
+    iterator = linguin.iter_detect_language if kind == 'language' else linguin.iter_detect_profanity
+
+    try:
+        for _, result in iterator(texts(), max_in_flight):
+            record, text = pending.popleft()
+
+            while not text:
+                write(record, None)
+                record, text = pending.popleft()
+
+            write(record, result)
+
+        for record, _ in pending:
+            write(record, None)
+    finally:
+        checkpoint.save(output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='linguin', description='Batch language and profanity detection with Linguin AI')
+    commands = parser.add_subparsers(dest='command', required=True)
+    command = commands.add_parser('detect', help='detect the language or profanity of every record of a file')
+    command.add_argument('kind', choices=('language', 'profanity'))
+    command.add_argument('--in', dest='input', required=True, help='input file, - for stdin')
+    command.add_argument('--out', dest='output', required=True, help='output JSON lines file')
+    command.add_argument('--field', default='text', help='field or column holding the text (default: text)')
+    command.add_argument('--format', choices=FORMATS, help='input format, guessed from the file extension by default')
+    command.add_argument('--result-field', default='linguin', help='field the result is written to (default: linguin)')
+    command.add_argument('--api-key', default=os.environ.get('LINGUIN_API_KEY'), help='defaults to $LINGUIN_API_KEY')
+    command.add_argument('--batch-size', type=int, default=Linguin.DEFAULT_MAX_BATCH_SIZE, help='texts per bulk request')
+    command.add_argument('--concurrency', type=int, default=4, help='bulk requests in flight')
+    command.add_argument('--retries', type=int, default=5, help='retries of rate limited or failed requests')
+    command.add_argument('--checkpoint-every', type=int, default=1000, help='records between checkpoints')
+    command.add_argument('--restart', action='store_true', help='ignore an existing checkpoint and start over')
+    command.add_argument('--base-uri', default=Linguin.BASE_URI, help=argparse.SUPPRESS)
+
+    return parser
+
+
+def guess_format(path):
+    extension = os.path.splitext(path)[1].lower()
+
+    return {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}.get(extension, 'text')
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if not args.api_key:
+        print('linguin: an API key is required, pass --api-key or set LINGUIN_API_KEY', file=sys.stderr)
+        return 2
+
+    checkpoint = Checkpoint(args.output + '.checkpoint')
+    resume = not args.restart and checkpoint.load()
+    format = args.format or guess_format(args.input)
+    linguin = Linguin(args.api_key, max_batch_size=args.batch_size, max_workers=args.concurrency,
+                      pool_size=args.concurrency, retry=RetryPolicy(max_retries=args.retries), base_uri=args.base_uri)
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8', newline='')
+    # failures left after retries and malformed input end the run, finished records are kept for resuming
+    errors = (LinguinError, ValueError) + linguin.transport.errors
+
+    try:
+        with source, open(args.output, 'r+b' if resume else 'wb') as output, linguin:
+            output.seek(checkpoint.offset)
+            output.truncate()
+            records = islice(read_records(source, format, args.field), checkpoint.records, None)
+
+            detect(linguin, args.kind, records, output, checkpoint, args.checkpoint_every, args.result_field, args.concurrency)
+    except errors as error:
+        print('linguin: {error}, {records} records done, run again to resume'.format(error=error, records=checkpoint.records), file=sys.stderr)
+        return 1
+
+    checkpoint.remove()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
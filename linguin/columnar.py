@@ -0,0 +1,145 @@
+"""Columnar views of bulk detection results
+
+Columns are array('d')/array('i') or, when NumPy is installed, NumPy arrays
+sharing the same buffers. Language codes are stored once in lang_codes and
+referenced by index from lang_ids, -1 marks texts without a candidate.
+"""
+from array import array
+from operator import itemgetter
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+
+def _use_numpy(use_numpy):
+    if use_numpy and numpy is None:
+        raise ImportError('NumPy columns require numpy, install it with: pip install numpy')
+
+    return numpy is not None if use_numpy is None else use_numpy
+
+
+class LanguageColumns:
+    """Best language guess per text of a bulk language detection
+
+    Attributes:
+        - lang_codes: list - distinct language codes
+        - lang_ids: array of int - index into lang_codes per text, -1 if there was no candidate
+        - confidence: array of float - confidence of the best guess per text, nan if there was no candidate
+          or the text failed in a partial bulk detection
+    """
+
+    __slots__ = ('lang_codes', 'lang_ids', 'confidence', 'is_numpy')
+
+    def __init__(self, lang_codes, lang_ids, confidence, use_numpy=None):
+        self.is_numpy = _use_numpy(use_numpy)
+        self.lang_codes = lang_codes
+
+        if self.is_numpy:
+            self.lang_ids = numpy.frombuffer(lang_ids, dtype=numpy.int32)
+            self.confidence = numpy.frombuffer(confidence, dtype=numpy.float64)
+        else:
+            self.lang_ids = lang_ids
+            self.confidence = confidence
+
+    @classmethod
+    def from_results(cls, results, use_numpy=None):
+        '''Builds columns from the 'results' list of a bulk language response'''
+        lang_codes = []
+        code_ids = {}
+        lang_ids = array('i')
+        confidence = array('d')
+
+        for candidates in results:
+            if not candidates:
+                lang_ids.append(-1)
+                confidence.append(float('nan'))
+                continue
+
+            best = max(candidates, key=itemgetter('confidence'))
+            code = best['lang']
+
+            if code not in code_ids:
+                code_ids[code] = len(lang_codes)
+                lang_codes.append(code)
+
+            lang_ids.append(code_ids[code])
+            confidence.append(best['confidence'])
+
+        return cls(lang_codes, lang_ids, confidence, use_numpy)
+
+    def __len__(self):
+        return len(self.lang_ids)
+
+    def top_lang_codes(self):
+        '''Returns the best language code per text, None if there was no candidate'''
+        if self.is_numpy:
+            return numpy.array(self.lang_codes + [None], dtype=object)[self.lang_ids]
+
+        codes = self.lang_codes + [None]
+        return [codes[lang_id] for lang_id in self.lang_ids]
+
+    def mask_above(self, threshold):
+        '''Returns a boolean mask of the texts whose best guess is more confident than threshold'''
+        if self.is_numpy:
+            return self.confidence > threshold
+
+        return [value > threshold for value in self.confidence]
+
+    def group_indices_by_lang(self):
+        '''Returns a dict of language code to the indices of the texts detected as it'''
+        if self.is_numpy:
+            if not len(self.lang_ids):
+                return {}
+
+            order = numpy.argsort(self.lang_ids, kind='stable')
+            sorted_ids = self.lang_ids[order]
+            boundaries = numpy.flatnonzero(numpy.diff(sorted_ids)) + 1
+            starts = numpy.concatenate(([0], boundaries))
+            groups = numpy.split(order, boundaries)
+
+            return {self.lang_codes[sorted_ids[start]]: group for start, group in zip(starts, groups) if sorted_ids[start] >= 0}
+
+        groups = {}
+        for index, lang_id in enumerate(self.lang_ids):
+            if lang_id >= 0:
+                groups.setdefault(self.lang_codes[lang_id], array('q')).append(index)
+
+        return groups
+
+
+class ProfanityColumns:
+    """Profanity score per text of a bulk profanity detection
+
+    Attributes:
+        - scores: array of float - profanity score per text, nan if the text failed in a partial bulk detection
+    """
+
+    __slots__ = ('scores', 'is_numpy')
+
+    def __init__(self, scores, use_numpy=None):
+        self.is_numpy = _use_numpy(use_numpy)
+        self.scores = numpy.frombuffer(scores, dtype=numpy.float64) if self.is_numpy else scores
+
+    @classmethod
+    def from_results(cls, scores, use_numpy=None):
+        '''Builds columns from the 'scores' list of a bulk profanity response'''
+        return cls(array('d', (float('nan') if score is None else score for score in scores)), use_numpy)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def mask_above(self, threshold):
+        '''Returns a boolean mask of the texts scoring above threshold'''
+        if self.is_numpy:
+            return self.scores > threshold
+
+        return [score > threshold for score in self.scores]
+
+    def indices_above(self, threshold):
+        '''Returns the indices of the texts scoring above threshold'''
+        if self.is_numpy:
+            return numpy.flatnonzero(self.scores > threshold)
+
+        return array('q', (index for index, score in enumerate(self.scores) if score > threshold))
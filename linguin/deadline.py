@@ -0,0 +1,78 @@
+"""End-to-end deadlines of client calls
+
+The deadline of the running call is kept in a context variable so that every
+layer below a public method (micro-batching, retries, rate limiting, the HTTP
+timeouts) can see how much time is left without passing it around.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+_expires_at = contextvars.ContextVar('linguin_deadline', default=None)
+
+
+@contextmanager
+def deadline_scope(seconds):
+    '''Sets a deadline seconds from now for the calls made inside, an earlier outer deadline wins
+
+    Parameters:
+        seconds (float): time budget, None for no deadline
+    '''
+    if seconds is None:
+        yield
+        return
+
+    expires_at = time.monotonic() + seconds
+    current = _expires_at.get()
+    token = _expires_at.set(expires_at if current is None else min(current, expires_at))
+
+    try:
+        yield
+    finally:
+        _expires_at.reset(token)
+
+
+def remaining():
+    '''Returns the seconds left until the current deadline, None without a deadline'''
+    expires_at = _expires_at.get()
+
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def expired():
+    left = remaining()
+
+    return left is not None and left <= 0
+
+
+def bound_timeout(timeout):
+    '''Returns timeout, a number or a (connect, read) tuple, capped by the time left'''
+    left = remaining()
+
+    if left is None:
+        return timeout
+
+    left = max(left, 0.001)
+
+    if isinstance(timeout, tuple):
+        return tuple(left if value is None else min(value, left) for value in timeout)
+
+    return left if timeout is None else min(timeout, left)
+
+
+def bind(fn):
+    '''Returns fn running under the current deadline when called on another thread'''
+    expires_at = _expires_at.get()
+
+    if expires_at is None:
+        return fn
+
+    def bound(*args, **kwargs):
+        token = _expires_at.set(expires_at)
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _expires_at.reset(token)
+
+    return bound
@@ -34,3 +34,11 @@ class LinguinInternalError(LinguinError):
 
 class LinguinUnknownError(LinguinError):
     pass
+
+
+class LinguinQuotaExceededError(LinguinRateLimitError):
+    pass
+
+
+class LinguinDeadlineExceededError(LinguinError):
+    pass
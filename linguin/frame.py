@@ -0,0 +1,156 @@
+"""Column-wise detection on pandas and Arrow tables
+
+detect_language() and detect_profanity() take a text column of a pandas
+DataFrame or Series, or of a pyarrow Table, Array or ChunkedArray. Each
+distinct non-empty text is sent once, in bulk calls of chunk_size texts whose
+requests the client dispatches concurrently. The results come back as typed
+columns aligned with the input rows. Null and empty cells, and texts the API
+rejects as invalid, get null results. Any other failure raises, so that rows
+never silently lose a result that a later call could have given them.
+
+Requires numpy and pandas or pyarrow (pip install linguin[pandas] or linguin[arrow]).
+"""
+from .columnar import LanguageColumns
+from .exceptions import LinguinInputError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def detect_language(linguin, data, column='text', chunk_size=DEFAULT_CHUNK_SIZE):
+    '''Detects the best language of every row of a text column
+
+    Parameters:
+        linguin (Linguin): client sending the bulk requests
+        data: pandas DataFrame or Series, pyarrow Table, Array or ChunkedArray
+        column (string): name of the text column of a DataFrame or Table
+        chunk_size (int): distinct texts per bulk call, bounds the results held at once
+
+    Returns:
+        for pandas input a DataFrame with the index of data and the columns
+        lang (category) and confidence (float64, nan for null results),
+        for Arrow input a Table with lang (dictionary<int32, string>) and confidence (double)
+
+    Raises:
+        the LinguinError or transport error of any text but invalid ones,
+        e.g. LinguinRateLimitError after retries or LinguinQuotaExceededError
+    '''
+    codes, uniques, build = _factorize(data, column)
+    code_ids = {}
+    lang_ids = numpy.full(len(uniques) + 1, -1, dtype=numpy.int32)
+    confidence = numpy.full(len(uniques) + 1, numpy.nan)
+
+    for start in range(0, len(uniques), chunk_size):
+        texts = uniques[start:start + chunk_size]
+        result = _checked(linguin.bulk_detect_language(texts, raise_on_error=True, partial=True))
+        columns = LanguageColumns.from_results(result['results'], use_numpy=True)
+        mapping = numpy.array([code_ids.setdefault(code, len(code_ids)) for code in columns.lang_codes] + [-1], dtype=numpy.int32)
+        lang_ids[start:start + len(texts)] = mapping[columns.lang_ids]
+        confidence[start:start + len(texts)] = columns.confidence
+
+    # codes of null cells are -1 and pick the null result stored last
+    return build({'lang': (lang_ids[codes], list(code_ids)), 'confidence': confidence[codes]})
+
+
+def detect_profanity(linguin, data, column='text', chunk_size=DEFAULT_CHUNK_SIZE):
+    '''Detects the profanity score of every row of a text column
+
+    Parameters:
+        linguin (Linguin): client sending the bulk requests
+        data: pandas DataFrame or Series, pyarrow Table, Array or ChunkedArray
+        column (string): name of the text column of a DataFrame or Table
+        chunk_size (int): distinct texts per bulk call, bounds the results held at once
+
+    Returns:
+        for pandas input a DataFrame with the index of data and the column
+        profanity_score (float64, nan for null results),
+        for Arrow input a Table with profanity_score (double)
+
+    Raises:
+        the LinguinError or transport error of any text but invalid ones,
+        e.g. LinguinRateLimitError after retries or LinguinQuotaExceededError
+    '''
+    codes, uniques, build = _factorize(data, column)
+    scores = numpy.full(len(uniques) + 1, numpy.nan)
+
+    for start in range(0, len(uniques), chunk_size):
+        texts = uniques[start:start + chunk_size]
+        result = _checked(linguin.bulk_detect_profanity(texts, raise_on_error=True, partial=True))
+        scores[start:start + len(texts)] = numpy.array(result['scores'], dtype=numpy.float64)
+
+    return build({'profanity_score': scores[codes]})
+
+
+def _checked(response):
+    '''Returns the result of a partial bulk response, raising any error but invalid texts'''
+    for error in response.result['errors'].values():
+        if not isinstance(error, LinguinInputError):
+            raise error
+
+    return response.result
+
+
+def _factorize(data, column):
+    '''Returns the index of every row into the distinct texts (-1 for nulls), the distinct texts
+    and a function building the output table from a dict of result columns
+    '''
+    if numpy is None:
+        raise ImportError('linguin.frame requires numpy, install it with: pip install numpy')
+
+    if type(data).__module__.split('.')[0] == 'pyarrow':
+        return _factorize_arrow(data, column)
+
+    return _factorize_pandas(data, column)
+
+
+def _factorize_pandas(data, column):
+    import pandas
+
+    series = data[column] if isinstance(data, pandas.DataFrame) else data
+    codes, uniques = pandas.factorize(series)
+
+    def build(columns):
+        return pandas.DataFrame({name: _pandas_column(values) for name, values in columns.items()}, index=series.index)
+
+    return codes, numpy.asarray(uniques, dtype=object), build
+
+
+def _pandas_column(values):
+    import pandas
+
+    if isinstance(values, tuple):
+        ids, categories = values
+        return pandas.Categorical.from_codes(ids, categories=categories)
+
+    return values
+
+
+def _factorize_arrow(data, column):
+    import pyarrow
+    import pyarrow.compute
+
+    array = data.column(column) if isinstance(data, pyarrow.Table) else data
+
+    if isinstance(array, pyarrow.ChunkedArray):
+        array = array.combine_chunks()
+
+    encoded = pyarrow.compute.dictionary_encode(array)
+
+    def build(columns):
+        return pyarrow.table({name: _arrow_column(values) for name, values in columns.items()})
+
+    return encoded.indices.fill_null(-1).to_numpy(), encoded.dictionary.to_pylist(), build
+
+
+def _arrow_column(values):
+    import pyarrow
+
+    if isinstance(values, tuple):
+        ids, categories = values
+        return pyarrow.DictionaryArray.from_arrays(pyarrow.array(ids, mask=ids < 0), pyarrow.array(categories, pyarrow.string()))
+
+    return pyarrow.array(values, mask=numpy.isnan(values))
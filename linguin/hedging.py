@@ -0,0 +1,66 @@
+"""Hedged requests against tail latency"""
+import math
+import threading
+from collections import deque
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow request
+
+    A request still running after the hedge delay is sent a second time, the
+    first response wins and the other one is discarded. Without a fixed delay
+    the given percentile of the recently observed latencies is used, and no
+    request is hedged before min_samples latencies were observed.
+
+    Only single detections (detect/*) are hedged and observed, bulk requests
+    take longer with every text and would be hedged whenever they follow fast
+    single calls. Every hedge is an extra request the server counts against
+    the quota, so keep the percentile high.
+
+    Attributes:
+        - delay: float - fixed seconds to wait before hedging, None to use the observed percentile
+        - percentile: float - percentile of the observed latencies used as delay, e.g. 95
+        - min_samples: int - latencies to observe before hedging with the percentile
+        - hedges: int - duplicate requests sent
+        - hedge_wins: int - duplicate requests that answered first
+    """
+
+    def __init__(self, delay=None, percentile=95, min_samples=20, window=1000):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=window)
+        self._cached_delay = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        '''Adds the latency of a finished request'''
+        with self._lock:
+            self._latencies.append(seconds)
+            self._cached_delay = None
+
+    def hedge_delay(self):
+        '''Returns the seconds to wait before hedging, None while there are too few latencies'''
+        if self.delay is not None:
+            return self.delay
+
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+
+            if self._cached_delay is None:
+                latencies = sorted(self._latencies)
+                rank = max(0, math.ceil(self.percentile / 100 * len(latencies)) - 1)
+                self._cached_delay = latencies[rank]
+
+            return self._cached_delay
+
+    def hedged(self):
+        with self._lock:
+            self.hedges += 1
+
+    def hedge_won(self):
+        with self._lock:
+            self.hedge_wins += 1
@@ -0,0 +1,176 @@
+"""Hooks for observing the client and a Prometheus compatible metrics aggregator"""
+import threading
+import time
+from bisect import bisect_left
+
+
+class RequestEvent:
+    """Measurements of one logical request including its retries
+
+    Attributes:
+        - method: str - HTTP method
+        - endpoint: str - API path, e.g. 'bulk_detect/language'
+        - texts: int - number of texts sent
+        - bytes_sent: int - request body size of the last attempt
+        - bytes_received: int - response body size of the last attempt
+        - status: int - HTTP status of the last attempt, None if it raised
+        - retries: int - attempts after the first one
+        - queue_seconds: float - time spent waiting on the rate limiter
+        - server_seconds: float - time from sending the last attempt until its response was read,
+          includes waiting for a pooled connection and DNS, connect and TLS of a new one,
+          which the transports don't report separately
+        - decode_seconds: float - time spent decoding the JSON response of a successful request
+        - total_seconds: float - time from start to end including retries and backoff
+        - error: Exception - exception raised by the last attempt
+    """
+
+    __slots__ = ('method', 'endpoint', 'texts', 'bytes_sent', 'bytes_received', 'status', 'retries',
+                 'queue_seconds', 'server_seconds', 'decode_seconds', 'total_seconds', 'error', 'started_at')
+
+    def __init__(self, method, endpoint, texts):
+        self.method = method
+        self.endpoint = endpoint
+        self.texts = texts
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status = None
+        self.retries = 0
+        self.queue_seconds = 0.0
+        self.server_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.total_seconds = 0.0
+        self.error = None
+        self.started_at = time.perf_counter()
+
+    def record(self, response, seconds):
+        '''Takes the measurements of an HTTP response received seconds after sending the request'''
+        self.bytes_received = len(response.content)
+        self.status = response.status_code
+        self.server_seconds = seconds
+
+    def finish(self, error=None):
+        self.error = error
+        self.total_seconds = time.perf_counter() - self.started_at
+
+
+class Instrumentation:
+    """Base class of instrumentation hooks, override the hooks you need
+
+    Hooks are called on the thread making the request and should return quickly.
+    """
+
+    def on_request_start(self, event):
+        '''Called with a RequestEvent before the first attempt is sent'''
+
+    def on_request_end(self, event):
+        '''Called with the completed RequestEvent after the last attempt'''
+
+    def on_cache(self, kind, hits, misses):
+        '''Called after looking up texts of an endpoint kind in the cache'''
+
+    def on_micro_batch(self, kind, size):
+        '''Called when a micro-batch of size single detections is flushed'''
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsAggregator(Instrumentation):
+    """Collects counters and latency histograms and renders them in the Prometheus text format"""
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='linguin'):
+        self.buckets = buckets
+        self.prefix = prefix
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, event):
+        endpoint = (('endpoint', event.endpoint),)
+        status = endpoint + (('status', 'error' if event.status is None else str(event.status)),)
+
+        with self._lock:
+            self._inc('requests_total', status)
+            self._inc('texts_total', endpoint, event.texts)
+            self._inc('retries_total', endpoint, event.retries)
+            self._inc('bytes_sent_total', endpoint, event.bytes_sent)
+            self._inc('bytes_received_total', endpoint, event.bytes_received)
+            self._observe('request_duration_seconds', endpoint, event.total_seconds)
+            self._observe('request_server_seconds', endpoint, event.server_seconds)
+            self._observe('request_queue_seconds', endpoint, event.queue_seconds)
+            self._observe('request_decode_seconds', endpoint, event.decode_seconds)
+
+    def on_cache(self, kind, hits, misses):
+        labels = (('kind', kind),)
+
+        with self._lock:
+            self._inc('cache_hits_total', labels, hits)
+            self._inc('cache_misses_total', labels, misses)
+
+    def on_micro_batch(self, kind, size):
+        labels = (('kind', kind),)
+
+        with self._lock:
+            self._inc('micro_batches_total', labels)
+            self._inc('micro_batch_texts_total', labels, size)
+
+    def to_prometheus(self):
+        '''Returns all metrics in the Prometheus text exposition format'''
+        lines = []
+
+        with self._lock:
+            for name in sorted(self.counters):
+                lines.append('# TYPE {prefix}_{name} counter'.format(prefix=self.prefix, name=name))
+
+                for labels, value in sorted(self.counters[name].items()):
+                    lines.append('{prefix}_{name}{labels} {value}'.format(prefix=self.prefix, name=name, labels=_labels(labels), value=value))
+
+            for name in sorted(self.histograms):
+                lines.append('# TYPE {prefix}_{name} histogram'.format(prefix=self.prefix, name=name))
+
+                for labels, histogram in sorted(self.histograms[name].items()):
+                    lines.extend(self._histogram_lines(name, labels, histogram))
+
+        return '\n'.join(lines) + '\n'
+
+    def _histogram_lines(self, name, labels, histogram):
+        cumulative = 0
+
+        for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+            cumulative += count
+            yield '{prefix}_{name}_bucket{labels} {value}'.format(
+                prefix=self.prefix, name=name, labels=_labels(labels + (('le', str(bound)),)), value=cumulative
+            )
+
+        yield '{prefix}_{name}_sum{labels} {value}'.format(prefix=self.prefix, name=name, labels=_labels(labels), value=histogram.sum)
+        yield '{prefix}_{name}_count{labels} {value}'.format(prefix=self.prefix, name=name, labels=_labels(labels), value=histogram.count)
+
+    def _inc(self, name, labels, value=1):
+        series = self.counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def _observe(self, name, labels, value):
+        series = self.histograms.setdefault(name, {})
+
+        if labels not in series:
+            series[labels] = Histogram(self.buckets)
+
+        series[labels].observe(value)
+
+
+def _labels(labels):
+    return '{' + ','.join('{key}="{value}"'.format(key=key, value=value) for key, value in labels) + '}'
@@ -0,0 +1,164 @@
+"""Process-wide cache of the supported languages"""
+import os
+import threading
+import time
+from .linguin_response import LinguinResponse
+
+
+class LanguageTable:
+    """Supported languages with a compact index
+
+    Language codes are numbered in sorted order, so ids are stable for the same
+    set of languages.
+
+    Attributes:
+        - data: dict - the /languages response, e.g. {'de': ['German', 'Deutsch'], ...}
+        - codes: list - sorted language codes, the position is the id of a code
+        - ids: dict - language code to id
+    """
+
+    __slots__ = ('data', 'codes', 'ids')
+
+    def __init__(self, data):
+        self.data = data
+        self.codes = sorted(data)
+        self.ids = {code: index for index, code in enumerate(self.codes)}
+
+    def __contains__(self, code):
+        return code in self.ids
+
+    def __len__(self):
+        return len(self.codes)
+
+    def id(self, code):
+        '''Returns the id of a language code, None if it is not supported'''
+        return self.ids.get(code)
+
+    def code(self, language_id):
+        '''Returns the language code of an id'''
+        return self.codes[language_id]
+
+    def name(self, code):
+        '''Returns the english name of a language code, None if it is not supported'''
+        names = self.data.get(code)
+
+        return names[0] if names else None
+
+    def native_name(self, code):
+        '''Returns the native name of a language code, None if it is not supported'''
+        names = self.data.get(code)
+
+        return names[-1] if names else None
+
+
+class LanguageCache:
+    """Keeps the language table for max_age seconds and revalidates it afterwards
+
+    Revalidation sends the ETag and Last-Modified of the cached table, so an
+    unchanged table costs a 304 response only. If path is given the table is
+    persisted there and survives restarts. A stale table is kept when
+    revalidation fails, and revalidation is retried after retry_interval
+    seconds instead of on every call.
+    """
+
+    def __init__(self, max_age=86400.0, path=None, retry_interval=60.0):
+        self.max_age = max_age
+        self.path = path
+        self.retry_interval = retry_interval
+        self.table = None
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = None
+        self._retry_at = None
+        self._lock = threading.Lock()
+
+    def get(self, fetch, refresh=False):
+        '''Returns the language table, calling fetch(headers) to load or revalidate it
+
+        fetch returns a response with status_code, headers, content and json().
+        Raises the LinguinError of a failed response if there is no table yet.
+        '''
+        with self._lock:
+            if self.table is None and self.path is not None:
+                self._load()
+
+            if self.table is not None and not refresh and self._is_fresh(time.time()):
+                return self.table
+
+            self._revalidate(fetch)
+
+            return self.table
+
+    def clear(self):
+        with self._lock:
+            self.table = None
+            self.etag = None
+            self.last_modified = None
+            self.fetched_at = None
+            self._retry_at = None
+
+    def _is_fresh(self, now):
+        return now - self.fetched_at < self.max_age or (self._retry_at is not None and now < self._retry_at)
+
+    def _conditional_headers(self):
+        headers = {}
+
+        if self.table is not None and self.etag:
+            headers['If-None-Match'] = self.etag
+
+        if self.table is not None and self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+    def _revalidate(self, fetch):
+        try:
+            response = fetch(self._conditional_headers())
+        except OSError:
+            if self.table is None:
+                raise
+            self._retry_at = time.time() + self.retry_interval
+            return
+
+        if response.status_code == 304 and self.table is not None:
+            self.fetched_at = time.time()
+        elif response.status_code == 200:
+            self.table = LanguageTable(response.json())
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
+            self.fetched_at = time.time()
+        elif self.table is None:
+            LinguinResponse(response).raise_on_error()
+        else:
+            self._retry_at = time.time() + self.retry_interval
+            return
+
+        self._retry_at = None
+
+        if self.path is not None:
+            self._save()
+
+    def _load(self):
+        import json
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        self.table = LanguageTable(stored['data'])
+        self.etag = stored.get('etag')
+        self.last_modified = stored.get('last_modified')
+        self.fetched_at = stored.get('fetched_at', 0)
+
+    def _save(self):
+        import json
+
+        stored = {'data': self.table.data, 'etag': self.etag, 'last_modified': self.last_modified, 'fetched_at': self.fetched_at}
+        temporary = '{path}.{pid}.tmp'.format(path=self.path, pid=os.getpid())
+
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(stored, file, ensure_ascii=False)
+
+        os.replace(temporary, self.path)
@@ -1,6 +1,39 @@
-import requests
+import threading
+import time
+from collections import deque
+from functools import partial
+from .cache import cache_key
+from .chunking import chunk_texts
+from .deadline import bind, bound_timeout, deadline_scope, expired, remaining
+from .encoding import RequestEncoder
+from .languages import LanguageCache
 from .linguin_response import LinguinResponse
-from .exceptions import LinguinInputError
+from .singleflight import SingleFlight
+from .transport import PoolTimeout, body_size, create_transport
+from .exceptions import LinguinInputError, LinguinQuotaExceededError, LinguinDeadlineExceededError
+
+EMPTY_TEXT_MESSAGES = {
+    'language': 'The language of an empty text is more of a philosophical question.',
+    'profanity': 'Can an empty text have profanity in it? I doubt it.'
+}
+EMPTY_BULK_MESSAGE = 'At least one of the texts provided was empty.'
+SINGLE_RESULT_KEYS = {
+    'language': 'results',
+    'profanity': 'score'
+}
+QUOTA_EXCEEDED_MESSAGE = 'The daily quota is not sufficient for this request.'
+BULK_RESULT_KEYS = {
+    'language': 'results',
+    'profanity': 'scores'
+}
+DEADLINE_EXCEEDED_MESSAGE = 'The deadline passed before a response arrived.'
+
+# marks the client's worker threads, work they fan out runs inline instead of queueing behind themselves
+_worker = threading.local()
+
+
+def _mark_worker():
+    _worker.active = True
 
 
 class Linguin:
@@ -13,122 +46,251 @@ class Linguin:
         /bulk_detect/profanity
         /status
         /languages
+
+    The client keeps a pool of keep-alive connections which is safe to share
+    between threads. Call close() or use the client as a context manager to
+    release the connections. The HTTP library is loaded with the transport on
+    the first request, see linguin.transport.
     """
 
     API_VERSION = 'v2'
     BASE_URI = 'https://api.linguin.ai'
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = (3.05, 30)
+    DEFAULT_MAX_BATCH_SIZE = 1000
+    DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+
+    language_cache = LanguageCache()
 
-    def __init__(self, api_key, raise_on_error=False):
+    _shared_transport = None
+    _shared_transport_lock = threading.Lock()
+
+    def __init__(self, api_key, raise_on_error=False, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_batch_bytes=DEFAULT_MAX_BATCH_BYTES, max_workers=None,
+                 cache=None, micro_batch_wait=None, micro_batch_size=None, retry=None, rate_limiter=None,
+                 quota=None, preclassifier=None, reducer=None, encoder=None, base_uri=BASE_URI, instrumentation=None,
+                 hedge=None, transport=None):
+        '''
+        Parameters:
+            api_key (string): your Linguin API key
+            raise_on_error (bool): raise LinguinErrors instead of returning them
+            pool_size (int): maximum number of keep-alive connections kept open
+            timeout (float or tuple): connect and read timeout in seconds, e.g. (3.05, 30)
+            max_batch_size (int): maximum number of texts sent in one bulk request
+            max_batch_bytes (int): maximum payload size of one bulk request
+            max_workers (int): number of bulk requests sent concurrently, defaults to pool_size
+            cache (MemoryCache or SQLiteCache): optional cache of detection results, see linguin.cache
+            micro_batch_wait (float): collect single detections for up to this many seconds and send them
+                as one bulk request, None sends every detection on its own
+            micro_batch_size (int): flush collected detections early at this many texts, defaults to max_batch_size
+            retry (RetryPolicy): optional policy for retrying rate limited, failed and timed out requests
+            rate_limiter (TokenBucket): optional limiter every request waits on, may be shared between clients
+            quota (QuotaTracker): optional local accounting of the daily quota, see linguin.quota
+            preclassifier (ScriptClassifier): optional local language detection for unambiguous texts,
+                see linguin.script
+            reducer (TextReducer): optional shortening of texts before language detection, see linguin.reduction
+            encoder (RequestEncoder): request body format and compression, defaults to plain form data,
+                falls back to it when the server rejects the format
+            base_uri (string): API host, e.g. a local test server
+            instrumentation (Instrumentation): optional hooks observing requests, cache and batching,
+                see linguin.instrumentation
+            hedge (HedgePolicy): optionally send a duplicate of requests slower than the hedge delay,
+                see linguin.hedging
+            transport (string or Transport): 'requests', 'urllib' or a Transport instance,
+                defaults to requests when it is installed, see linguin.transport
+        '''
         self.api_key = api_key
         self.headers = {
             'Authorization': 'Bearer ' + self.api_key
         }
         self.raise_on_error = raise_on_error
-
-    def detect_language(self, text, raise_on_error=False):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_workers = max_workers or pool_size
+        self.cache = cache
+        self.micro_batch_wait = micro_batch_wait
+        self.micro_batch_size = micro_batch_size or max_batch_size
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.quota = quota
+        self.preclassifier = preclassifier
+        self.reducer = reducer
+        self.encoder = encoder or RequestEncoder()
+        self.base_uri = base_uri
+        self.instrumentation = instrumentation
+        self.hedge = hedge
+        self._single_flight = SingleFlight()
+        self._batchers = {}
+        self._transport_option = transport
+        self._transport = None
+        self._executor = None
+        self._hedge_executor = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        '''Closes all pooled connections and stops the worker threads'''
+        for batcher in self._batchers.values():
+            batcher.close()
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=True)
+                self._hedge_executor = None
+
+        if self._transport is not None:
+            self._transport.close()
+
+    @property
+    def transport(self):
+        '''Returns the client's transport, creating it on first use'''
+        if self._transport is None:
+            with self._executor_lock:
+                if self._transport is None:
+                    self._transport = create_transport(self._transport_option, self.pool_size)
+
+        return self._transport
+
+    @property
+    def session(self):
+        '''Returns the requests.Session of the requests transport'''
+        return self.transport.session
+
+    def detect_language(self, text, raise_on_error=False, deadline=None):
         '''Returns detection response from the server and raises errors
 
         Parameters:
             text (string): query text for detection
+            deadline (float): seconds the call may take including retries, after which
+                it returns a LinguinDeadlineExceededError
 
         Returns:
             a LinguinResponse object containing
             parsed json response (dict)
             e.g. {'results': [{'lang': 'en', 'confidence': 1.0}, {'lang': 'de', 'confidence': 0.2}]}
         '''
-        text = self.__sanitize(text)
+        with deadline_scope(deadline):
+            response = self._detect('language', text)
 
-        if not text:
-            error = LinguinInputError(400, 'The language of an empty text is more of a philosophical question.')
-            return LinguinResponse(error=error)
+        return self.__finish(response, raise_on_error)
 
-        url = '{base}/{version}/detect/language'.format(base=self.BASE_URI, version=self.API_VERSION)
-        payload = {'q': text}
-        response = requests.post(url, data=payload, headers=self.headers)
-
-        if raise_on_error or self.raise_on_error:
-            response.raise_on_error()
-
-        return LinguinResponse(response=response)
-
-    def detect_profanity(self, text, raise_on_error=False):
+    def detect_profanity(self, text, raise_on_error=False, deadline=None):
         '''Returns detection response from the server and raises errors
 
         Parameters:
             text (string): query text for detection
+            deadline (float): seconds the call may take including retries, after which
+                it returns a LinguinDeadlineExceededError
 
         Returns:
             a LinguinResponse object containing
             parsed json response (dict)
             e.g. {'score': 1.0}
         '''
-        text = self.__sanitize(text)
-
-        if not text:
-            error = LinguinInputError(400, 'Can an empty text have profanity in it? I doubt it.')
-            return LinguinResponse(error=error)
+        with deadline_scope(deadline):
+            response = self._detect('profanity', text)
 
-        url = '{base}/{version}/detect/profanity'.format(base=self.BASE_URI, version=self.API_VERSION)
-        payload = {'q': text}
-        response = requests.post(url, data=payload, headers=self.headers)
+        return self.__finish(response, raise_on_error)
 
-        if raise_on_error or self.raise_on_error:
-            response.raise_on_error()
-
-        return LinguinResponse(response=response)
-
-    def bulk_detect_language(self, texts, raise_on_error=False):
+    def bulk_detect_language(self, texts, raise_on_error=False, partial=False, deadline=None):
         '''Returns bulk detection response from the server and raises errors
 
+        Large inputs are split into chunks of at most max_batch_size texts and
+        max_batch_bytes payload bytes which are sent concurrently.
+
         Parameters:
             texts (array of strings): query texts for bulk detection
+            partial (bool): skip empty texts and bisect chunks failing with 5xx
+                instead of failing the whole call
+            deadline (float): seconds the call may take including retries, after which
+                it returns a LinguinDeadlineExceededError
 
         Returns:
             a LinguinResponse object containing
             parsed json response (dict)
             e.g. [ {'results': [{'lang': 'en', 'confidence': 1.0}]},
                    {'results': [{'lang': 'de', 'confidence': 0.2}]} ]
+            with partial, failed texts get None and their LinguinError or transport error under 'errors' by index
+            e.g. {'errors': {3: LinguinInputError(...)}}
         '''
-        texts = list(map(self.__sanitize, texts))
-
-        if any(not isinstance(text, str) or len(text) == 0 for text in texts):
-            error = LinguinInputError(400, 'At least one of the texts provided was empty.')
-            return LinguinResponse(error=error)
-
-        url = '{base}/{version}/bulk_detect/language'.format(base=self.BASE_URI, version=self.API_VERSION)
-        payload = {'q[]': texts}
-        response = requests.post(url, data=payload, headers=self.headers)
+        with deadline_scope(deadline):
+            response = self._bulk_detect('language', texts, partial)
 
-        if raise_on_error or self.raise_on_error:
-            response.raise_on_error()
+        return self.__finish(response, raise_on_error)
 
-        return LinguinResponse(response)
-
-    def bulk_detect_profanity(self, texts, raise_on_error=False):
+    def bulk_detect_profanity(self, texts, raise_on_error=False, partial=False, deadline=None):
         '''Returns bulk detection response from the server and raises errors
 
+        Large inputs are split into chunks of at most max_batch_size texts and
+        max_batch_bytes payload bytes which are sent concurrently.
+
         Parameters:
             texts (array of strings): query texts for bulk detection
+            partial (bool): skip empty texts and bisect chunks failing with 5xx
+                instead of failing the whole call
+            deadline (float): seconds the call may take including retries, after which
+                it returns a LinguinDeadlineExceededError
 
         Returns:
             a LinguinResponse object containing
             parsed json response (dict)
             ie. {'scores': [1.0, 0.046]}
+            with partial, failed texts get None and their LinguinError or transport error under 'errors' by index
+            e.g. {'errors': {3: LinguinInputError(...)}}
         '''
-        texts = list(map(self.__sanitize, texts))
+        with deadline_scope(deadline):
+            response = self._bulk_detect('profanity', texts, partial)
 
-        if any(not isinstance(text, str) or len(text) == 0 for text in texts):
-            error = LinguinInputError(400, 'At least one of the texts provided was empty.')
-            return LinguinResponse(error=error)
+        return self.__finish(response, raise_on_error)
 
-        url = '{base}/{version}/bulk_detect/profanity'.format(base=self.BASE_URI, version=self.API_VERSION)
-        payload = {'q[]': texts}
-        response = requests.post(url, data=payload, headers=self.headers)
+    def iter_detect_language(self, texts, max_in_flight=None):
+        '''Lazily detects the language of an iterable of texts of any size
 
-        if raise_on_error or self.raise_on_error:
-            response.raise_on_error()
+        Texts are pulled from the iterable as needed and sent in bulk chunks,
+        at most max_in_flight chunks are pending at any time.
 
-        return LinguinResponse(response)
+        Parameters:
+            texts (iterable of strings): query texts for detection
+            max_in_flight (int): number of pending bulk requests, defaults to max_workers
+
+        Yields:
+            (index, results) tuples in input order
+            e.g. (0, [{'lang': 'en', 'confidence': 1.0}])
+
+        Raises:
+            LinguinError of the first failed chunk or empty text
+        '''
+        return self._iter_detect('language', texts, max_in_flight)
+
+    def iter_detect_profanity(self, texts, max_in_flight=None):
+        '''Lazily detects profanity in an iterable of texts of any size
+
+        Texts are pulled from the iterable as needed and sent in bulk chunks,
+        at most max_in_flight chunks are pending at any time.
+
+        Parameters:
+            texts (iterable of strings): query texts for detection
+            max_in_flight (int): number of pending bulk requests, defaults to max_workers
+
+        Yields:
+            (index, score) tuples in input order
+            e.g. (0, 0.046)
+
+        Raises:
+            LinguinError of the first failed chunk or empty text
+        '''
+        return self._iter_detect('profanity', texts, max_in_flight)
 
     def status(self, raise_on_error=False):
         '''Returns api usage status from the server and raises errors
@@ -138,23 +300,624 @@ class Linguin:
             parsed json response (dict)
             e.g. {'daily_limit': 10000, 'detections_today': 8000, 'remaining_today': 2000}
         '''
-        url = '{base}/{version}/status'.format(base=self.BASE_URI, version=self.API_VERSION)
-        response = requests.get(url, headers=self.headers)
+        response = self._request('GET', 'status')
 
-        if raise_on_error or self.raise_on_error:
-            response.raise_on_error()
+        if self.quota is not None and response.is_success:
+            self.quota.update(response.result)
+
+        return self.__finish(response, raise_on_error)
+
+    @classmethod
+    def languages(cls, refresh=False):
+        '''Returns list of supported languages
+
+        The list is cached for the whole process, see language_table.
+        '''
+        return cls.language_table(refresh).data
+
+    @classmethod
+    def language_table(cls, refresh=False):
+        '''Returns the cached LanguageTable of supported languages
+
+        The table is revalidated with the server once language_cache.max_age has
+        passed or when refresh is set.
+        '''
+        return cls.language_cache.get(cls._fetch_languages, refresh)
+
+    @classmethod
+    def _fetch_languages(cls, headers):
+        return cls._get_shared_transport().request('GET', cls._url('languages'), headers=headers, timeout=cls.DEFAULT_TIMEOUT)
+
+    @classmethod
+    def _url(cls, path, base_uri=None):
+        return '{base}/{version}/{path}'.format(base=base_uri or cls.BASE_URI, version=cls.API_VERSION, path=path)
+
+    def _detect(self, kind, text):
+        text = self._prepare(kind, text)
+
+        if not text:
+            return LinguinResponse(error=LinguinInputError(400, EMPTY_TEXT_MESSAGES[kind]))
+
+        key = SINGLE_RESULT_KEYS[kind]
+        resolved = self._resolve(kind, [text])
+
+        if resolved:
+            return LinguinResponse(result={key: resolved[0]})
+
+        # concurrent.futures pulls in logging, it is imported on the first request instead of with linguin
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        try:
+            response = self._single_flight.do((kind, text), lambda: self._send_single(kind, text), remaining())
+        except FutureTimeoutError:
+            return self._deadline_exceeded()
+
+        if isinstance(response.error, LinguinDeadlineExceededError) and not expired():
+            # the call in flight ran out of the deadline of the thread that started it, not of this one
+            return self._send_single(kind, text)
+
+        return response
+
+    def _send_single(self, kind, text):
+        if self.micro_batch_wait is not None:
+            from concurrent.futures import TimeoutError as FutureTimeoutError
+
+            try:
+                return self._get_batcher(kind).submit(text).result(remaining())
+            except FutureTimeoutError:
+                return self._deadline_exceeded()
+
+        response = self._post('detect/' + kind, {'q': text})
+
+        if response.is_success:
+            self._store(kind, [text], [response.result[SINGLE_RESULT_KEYS[kind]]])
+
+        return response
+
+    def _bulk_detect(self, kind, texts, partial=False):
+        '''Prepares texts and detects them, see _bulk_detect_prepared'''
+        texts = [self._prepare(kind, text) for text in texts]
+
+        if not partial and not all(texts):
+            return LinguinResponse(error=LinguinInputError(400, EMPTY_BULK_MESSAGE))
+
+        return self._bulk_detect_prepared(kind, texts, partial)
+
+    def _bulk_detect_prepared(self, kind, texts, partial=False):
+        '''Resolves prepared texts locally or from the cache and sends each remaining unique text once
+
+        Results are fanned back out to every position in the original order.
+        With partial, empty texts and texts whose chunk failed are reported
+        by index in an errors dict instead of failing the whole call.
+        '''
+        key = BULK_RESULT_KEYS[kind]
+        errors = {index: LinguinInputError(400, EMPTY_TEXT_MESSAGES[kind]) for index, text in enumerate(texts) if not text}
+        resolved = self._resolve(kind, texts)
+        positions = {}
+
+        for index, text in enumerate(texts):
+            if index not in resolved and index not in errors:
+                positions.setdefault(text, []).append(index)
+
+        if positions:
+            unique = list(positions)
+            response = self._send_bulk(kind, unique, partial)
+
+            if not response.is_success:
+                return response
+
+            if not partial and len(unique) == len(texts):
+                self._store(kind, unique, response.result[key])
+                return response
+
+            self._fan_out(kind, unique, positions, response.result, resolved, errors)
+
+        result = {key: [resolved.get(index) for index in range(len(texts))]}
+
+        if partial:
+            result['errors'] = errors
+
+        return LinguinResponse(result=result)
+
+    def _fan_out(self, kind, unique, positions, result, resolved, errors):
+        '''Copies the result or error of each unique text to all of its positions and caches the results'''
+        failed = result.get('errors', {})
+        sent = []
+
+        for index, (text, value) in enumerate(zip(unique, result[BULK_RESULT_KEYS[kind]])):
+            if index in failed:
+                errors.update(dict.fromkeys(positions[text], failed[index]))
+            else:
+                resolved.update(dict.fromkeys(positions[text], value))
+                sent.append((text, value))
+
+        if sent:
+            self._store(kind, *zip(*sent))
+
+    def _send_bulk(self, kind, texts, partial=False):
+        '''Sends texts in chunks and merges the results in the original order'''
+        if self.quota is not None and self.quota.enforce and not self.quota.can_send(len(texts)):
+            return LinguinResponse(error=LinguinQuotaExceededError(429, QUOTA_EXCEEDED_MESSAGE))
+
+        chunks = list(chunk_texts(texts, self.max_batch_size, self.max_batch_bytes, self.encoder.text_size))
+        path = 'bulk_detect/' + kind
+        key = BULK_RESULT_KEYS[kind]
+
+        if partial:
+            return self._send_partial(path, key, chunks)
+
+        if len(chunks) == 1:
+            return self._post(path, {'q[]': chunks[0]})
+
+        responses = self._map(lambda chunk: self._post(path, {'q[]': chunk}), chunks)
+        merged = []
+
+        for response in responses:
+            if not response.is_success:
+                return response
+
+            merged.extend(response.result[key])
+
+        return LinguinResponse(result={key: merged})
+
+    def _send_partial(self, path, key, chunks):
+        '''Sends chunks bisecting failed ones, returns the results with None and an errors dict for failed texts'''
+        if len(chunks) == 1:
+            outcomes = [self._post_bisecting(path, key, chunks[0])]
+        else:
+            outcomes = self._map(lambda chunk: self._post_bisecting(path, key, chunk), chunks)
+
+        merged = []
+        errors = {}
+
+        for results, chunk_errors in outcomes:
+            errors.update((len(merged) + index, error) for index, error in chunk_errors.items())
+            merged.extend(results)
+
+        return LinguinResponse(result={key: merged, 'errors': errors})
+
+    def _post_bisecting(self, path, key, chunk):
+        '''Sends a chunk, on 5xx errors sends both halves separately down to single texts
+
+        A 429 fails the whole chunk, splitting it would only send more requests
+        to a server asking for fewer. The retry policy has backed off and resent
+        the chunk already. So does a connection error or timeout left after
+        retries, it is reported for every text of the chunk.
+        '''
+        try:
+            response = self._post(path, {'q[]': chunk})
+        except self.transport.errors as error:
+            return [None] * len(chunk), dict.fromkeys(range(len(chunk)), error)
+
+        if response.is_success:
+            return response.result[key], {}
+
+        if len(chunk) == 1 or response.error.status < 500:
+            return [None] * len(chunk), dict.fromkeys(range(len(chunk)), response.error)
+
+        middle = len(chunk) // 2
+        results, errors = self._post_bisecting(path, key, chunk[:middle])
+        right_results, right_errors = self._post_bisecting(path, key, chunk[middle:])
+        errors.update((middle + index, error) for index, error in right_errors.items())
+
+        return results + right_results, errors
+
+    def _prepare(self, kind, text):
+        '''Returns the sanitized text, reduced for language detection if a reducer is set'''
+        text = self._sanitize(text)
+
+        if kind == 'language' and self.reducer is not None and text:
+            return self.reducer.reduce(text)
+
+        return text
+
+    def _resolve(self, kind, texts):
+        '''Returns a dict of the results known without a request by index of the texts'''
+        resolved = {}
+
+        if kind == 'language' and self.preclassifier is not None:
+            for index, text in enumerate(texts):
+                result = self.preclassifier.classify(text) if text else None
+
+                if result is not None:
+                    resolved[index] = result
+
+        if self.cache is None or len(resolved) == len(texts):
+            return resolved
+
+        keys = {index: cache_key(self.API_VERSION, kind, text) for index, text in enumerate(texts) if text and index not in resolved}
+        found = self.cache.get_many(keys.values())
+        resolved.update((index, found[key]) for index, key in keys.items() if key in found)
+
+        if self.instrumentation is not None:
+            hits = sum(key in found for key in keys.values())
+            self.instrumentation.on_cache(kind, hits, len(keys) - hits)
 
-        return LinguinResponse(response)
+        return resolved
+
+    def _store(self, kind, texts, results):
+        if self.cache is not None:
+            self.cache.set_many({cache_key(self.API_VERSION, kind, text): result for text, result in zip(texts, results)})
+
+    def _iter_detect(self, kind, texts, max_in_flight):
+        key = BULK_RESULT_KEYS[kind]
+        # sized with the current encoder, which changes when the server rejects the configured body format
+        chunks = chunk_texts(self._iter_prepared(kind, texts), self.max_batch_size, self.max_batch_bytes, lambda text: self.encoder.text_size(text))
+        pending = deque()
+        index = 0
+
+        try:
+            for chunk in chunks:
+                pending.append(self._get_executor().submit(self._bulk_detect_prepared, kind, chunk))
+
+                if len(pending) >= (max_in_flight or self.max_workers):
+                    for result in self._chunk_results(pending.popleft(), key):
+                        yield index, result
+                        index += 1
+
+            while pending:
+                for result in self._chunk_results(pending.popleft(), key):
+                    yield index, result
+                    index += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _iter_prepared(self, kind, texts):
+        for index, text in enumerate(texts):
+            text = self._prepare(kind, text)
+
+            if not text:
+                raise LinguinInputError(400, 'The text at index {index} was empty.'.format(index=index))
+
+            yield text
+
+    @staticmethod
+    def _chunk_results(future, key):
+        response = future.result()
+        response.raise_on_error()
+
+        return response.result[key]
+
+    def _get_batcher(self, kind):
+        from .batcher import MicroBatcher
+
+        with self._executor_lock:
+            if kind not in self._batchers:
+                flush = partial(self._flush_micro_batch, kind)
+                self._batchers[kind] = MicroBatcher(flush, self.micro_batch_size, self.micro_batch_wait, self.max_workers)
+
+            return self._batchers[kind]
+
+    def _flush_micro_batch(self, kind, texts):
+        '''Sends collected single detections as one bulk request and splits the response per text
+
+        The texts are prepared and missed the cache in _detect already, so they are sent as they are.
+        '''
+        if self.instrumentation is not None:
+            self.instrumentation.on_micro_batch(kind, len(texts))
+
+        unique = list(dict.fromkeys(texts))
+        response = self._send_bulk(kind, unique)
+
+        if not response.is_success:
+            return [response] * len(texts)
+
+        results = response.result[BULK_RESULT_KEYS[kind]]
+        self._store(kind, unique, results)
+        by_text = dict(zip(unique, results))
+        key = SINGLE_RESULT_KEYS[kind]
+
+        return [LinguinResponse(result={key: by_text[text]}) for text in texts]
+
+    def _map(self, fn, items):
+        '''Applies fn to items on the worker threads, returns results in order
+
+        On a worker thread fn runs inline, waiting on tasks queued behind the
+        caller could take every worker of the bounded pool.
+        '''
+        if getattr(_worker, 'active', False):
+            return [fn(item) for item in items]
+
+        return list(self._get_executor().map(bind(fn), items))
+
+    def _get_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='linguin', initializer=_mark_worker)
+
+            return self._executor
+
+    def _get_hedge_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=2 * self.pool_size, thread_name_prefix='linguin-hedge')
+
+            return self._hedge_executor
+
+    def _post(self, path, payload):
+        '''Sends a detection request, counting its texts against the local quota'''
+        if self.quota is None:
+            return self._request('POST', path, payload)
+
+        count = self._count_texts(payload)
+
+        if self.quota.needs_sync():
+            self._sync_quota()
+
+        if not self.quota.reserve(count):
+            return LinguinResponse(error=LinguinQuotaExceededError(429, QUOTA_EXCEEDED_MESSAGE))
+
+        try:
+            response = self._request('POST', path, payload)
+        except BaseException:
+            self.quota.release(count)
+            raise
+
+        if not response.is_success:
+            self.quota.release(count)
+
+        return response
+
+    def _send(self, method, path, payload, headers, event=None):
+        '''Sends one request, single detections are hedged if the client has a hedge policy
+
+        Bulk and status requests are neither hedged nor timed, their latencies
+        would skew the percentile of the single detections.
+        '''
+        if self.hedge is None or not path.startswith('detect/'):
+            return self._send_encoded(method, path, payload, headers, event)
+
+        send = bind(partial(self._send_timed, method, path, payload, headers, event))
+        delay = self.hedge.hedge_delay()
+
+        if delay is None:
+            return send()
+
+        return self._send_hedged(send, delay, self._hedge_quota(headers), self._count_texts(payload))
+
+    def _send_hedged(self, send, delay, quota=None, count=0):
+        '''Sends a duplicate if there is no response after delay seconds, returns the first response
+
+        The duplicate is counted against quota, the server bills it when it arrives.
+        '''
+        from concurrent.futures import wait
+
+        executor = self._get_hedge_executor()
+        futures = [executor.submit(send)]
+        left = remaining()
+        done, _ = wait(futures, timeout=delay if left is None else min(delay, left))
+
+        if not done and not expired() and (quota is None or quota.reserve(count)):
+            futures.append(executor.submit(send))
+            self.hedge.hedged()
+
+        return self._first_response(futures)
+
+    def _first_response(self, futures):
+        '''Returns the first successful response of futures, the others are cancelled or closed when they finish'''
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        pending = set(futures)
+        winner = None
+        failure = None
+
+        try:
+            while pending and winner is None:
+                done, pending = wait(pending, timeout=remaining(), return_when=FIRST_COMPLETED)
+
+                if not done:
+                    raise TimeoutError(DEADLINE_EXCEEDED_MESSAGE)
+
+                for future in done:
+                    if future.exception() is None:
+                        winner = winner or future
+                    else:
+                        failure = failure or future.exception()
+
+            if winner is None:
+                raise failure
+
+            if winner is not futures[0]:
+                self.hedge.hedge_won()
+
+            return winner.result()
+        finally:
+            for future in futures:
+                if future is not winner and not future.cancel():
+                    future.add_done_callback(_close_response)
+
+    def _hedge_quota(self, headers):
+        '''Returns the QuotaTracker of the key in headers, None if quota is not tracked'''
+        return self.quota
+
+    def _send_timed(self, method, path, payload, headers, event=None):
+        started = time.perf_counter()
+        response = self._send_encoded(method, path, payload, headers, event)
+        self.hedge.record(time.perf_counter() - started)
+
+        return response
+
+    def _send_encoded(self, method, path, payload, headers, event=None):
+        '''Sends one request with the body encoded by the client's encoder, recording its size on event'''
+        options = {'timeout': bound_timeout(self.timeout)}
+        left = remaining()
+
+        if left is not None:
+            options['pool_timeout'] = max(left, 0)
+
+        if payload is None:
+            return self.transport.request(method, self._url(path, self.base_uri), headers=headers, **options)
+
+        encoder = self.encoder
+        data, body_headers = encoder.encode(payload)
+
+        if event is not None:
+            event.bytes_sent = body_size(data)
+
+        response = self.transport.request(method, self._url(path, self.base_uri), data=data, headers=dict(headers, **body_headers), **options)
+
+        if response.status_code in encoder.FALLBACK_STATUSES and not encoder.is_plain_form:
+            self.encoder = RequestEncoder()
+            return self._send_encoded(method, path, payload, headers, event)
+
+        return response
+
+    def _sync_quota(self):
+        '''Refreshes the quota from /status, a failed sync keeps the local counts'''
+        try:
+            response = self._request('GET', 'status')
+        except self.transport.errors:
+            self.quota.sync_failed()
+            return
+
+        if response.is_success:
+            self.quota.update(response.result)
+        else:
+            self.quota.sync_failed()
+
+    def _request(self, method, path, payload=None, headers=None):
+        '''Sends a request over the transport, reporting it to the instrumentation
+
+        headers replace the client's authorization headers for this request.
+        '''
+        headers = headers or self.headers
+
+        if self.instrumentation is None:
+            return self._request_with_retries(method, path, payload, headers)
+
+        from .instrumentation import RequestEvent
+
+        event = RequestEvent(method, path, self._count_texts(payload))
+        self.instrumentation.on_request_start(event)
+
+        try:
+            response = self._request_with_retries(method, path, payload, headers, event)
+
+            if response.is_success:
+                # decoded now instead of on first access to time it
+                started = time.perf_counter()
+                response.result
+                event.decode_seconds = time.perf_counter() - started
+        except Exception as error:
+            event.finish(error)
+            self.instrumentation.on_request_end(event)
+            raise
+
+        event.finish()
+        self.instrumentation.on_request_end(event)
+
+        return response
+
+    def _request_with_retries(self, method, path, payload, headers, event=None):
+        '''Sends a request, retrying as the retry policy and the deadline allow'''
+        retry = self.retry
+        attempt = 0
+
+        if retry is not None and retry.budget is not None:
+            retry.budget.deposit()
+
+        while True:
+            if not self._ready_to_send(attempt, event):
+                return self._deadline_exceeded()
+
+            started = time.perf_counter()
+
+            try:
+                response = self._send(method, path, payload, headers, event)
+            except self.transport.errors as error:
+                if expired() or isinstance(error, PoolTimeout):
+                    return self._deadline_exceeded()
+
+                if not self._back_off(attempt):
+                    raise
+
+                attempt += 1
+                continue
+
+            if event is not None:
+                event.record(response, time.perf_counter() - started)
+
+            if response.status_code == 200 or not self._back_off(attempt, response.status_code, response.headers.get('Retry-After')):
+                return LinguinResponse(response)
+
+            attempt += 1
+
+    def _back_off(self, attempt, status=None, retry_after=None):
+        '''Sleeps before the next attempt and returns True if the failed attempt should be retried'''
+        retry = self.retry
+
+        if retry is None:
+            return False
+
+        delay = retry.delay(attempt, retry_after)
+        left = remaining()
+
+        if (left is not None and delay >= left) or not retry.should_retry(attempt, status):
+            return False
+
+        time.sleep(delay)
+        return True
+
+    def _ready_to_send(self, attempt, event):
+        '''Waits for the rate limiter, returns False if the deadline passes first'''
+        if event is not None:
+            event.retries = attempt
+
+        if expired():
+            return False
+
+        return self.rate_limiter is None or self._wait_for_rate_limiter(event)
+
+    def _wait_for_rate_limiter(self, event):
+        '''Waits for a token of the rate limiter, returns False if none is available before the deadline'''
+        if event is None:
+            return self.rate_limiter.acquire(timeout=remaining())
+
+        started = time.perf_counter()
+        acquired = self.rate_limiter.acquire(timeout=remaining())
+        event.queue_seconds += time.perf_counter() - started
+
+        return acquired
+
+    @staticmethod
+    def _deadline_exceeded():
+        return LinguinResponse(error=LinguinDeadlineExceededError(408, DEADLINE_EXCEEDED_MESSAGE))
+
+    @staticmethod
+    def _count_texts(payload):
+        '''Returns the number of texts a request payload detects'''
+        if not payload:
+            return 0
+
+        return len(payload['q[]']) if 'q[]' in payload else 1
 
     @classmethod
-    def languages(cls):
-        '''Returns list of supported languages'''
-        url = '{base}/{version}/languages'.format(base=cls.BASE_URI, version=cls.API_VERSION)
-        response = requests.get(url)
+    def _get_shared_transport(cls):
+        '''Returns the process-wide transport used by unauthenticated class-level calls'''
+        with cls._shared_transport_lock:
+            if Linguin._shared_transport is None:
+                Linguin._shared_transport = create_transport(None, cls.DEFAULT_POOL_SIZE)
+
+            return Linguin._shared_transport
 
-        return response.json()
+    def __finish(self, response, raise_on_error):
+        if raise_on_error or self.raise_on_error:
+            response.raise_on_error()
+
+        return response
 
     @staticmethod
-    def __sanitize(text):
+    def _sanitize(text):
         '''Returns text striped of white spaces '''
         return str(text).strip()
+
+
+def _close_response(future):
+    '''Releases the connection of a discarded hedged request'''
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
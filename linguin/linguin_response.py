@@ -1,3 +1,4 @@
+from operator import itemgetter
 from .exceptions import LinguinInputError
 from .exceptions import LinguinAuthenticationError
 from .exceptions import LinguinNotFoundError
@@ -5,10 +6,29 @@ from .exceptions import LinguinRateLimitError
 from .exceptions import LinguinInternalError
 from .exceptions import LinguinUnknownError
 
+_json_loads = None
+_UNPARSED = object()
+
+
+def json_loads(content):
+    '''Parses a JSON body with orjson when it is installed, imported on the first call'''
+    global _json_loads
+
+    if _json_loads is None:
+        try:
+            from orjson import loads as _json_loads
+        except ImportError:  # pragma: no cover - optional dependency
+            from json import loads as _json_loads
+
+    return _json_loads(content)
+
 
 class LinguinResponse:
     """Wrapper class for Linguin API response
 
+    Only the status code and raw body of the HTTP response are kept, the body
+    is decoded on first access to result (with orjson when installed).
+
     Attributes:
         - is_success: bool - whether the call was successful
         - error: LinguinError object containing status code and message
@@ -16,6 +36,8 @@ class LinguinResponse:
         e.g. {'results': [{'lang': 'en', 'confidence': 1.0}, {'lang': 'de', 'confidence': 0.2}]}
     """
 
+    __slots__ = ('is_success', 'error', '_content', '_result')
+
     ERROR_CLS_MAP = {
         400: LinguinInputError,
         401: LinguinAuthenticationError,
@@ -27,23 +49,85 @@ class LinguinResponse:
     }
 
     def __build_error(self, response):
-        error_class = self.ERROR_CLS_MAP.get(response.status_code)
+        error_class = self.ERROR_CLS_MAP.get(response.status_code, LinguinUnknownError)
+        message = response.content.decode('utf-8', errors='replace')
+
+        return error_class(response.status_code, message)
 
-        if error_class:
-            return error_class(response.status_code, response.text)
-        else:
-            return LinguinUnknownError(response.status_code, response.text)
+    def __init__(self, response=None, error=None, result=None):
+        self.is_success = False
+        self.error = None
+        self._content = None
+        self._result = None
 
-    def __init__(self, response=None, error=None):
         if response is not None:
             self.is_success = response.status_code == 200
             self.error = None if self.is_success else self.__build_error(response)
-            self.result = response.json() if self.is_success else None
+            self._content = response.content if self.is_success else None
+            self._result = _UNPARSED if self.is_success else None
 
         if error is not None:
             self.is_success = False
             self.error = error
-            self.result = None
+            self._result = None
+
+        if result is not None:
+            self.is_success = True
+            self.error = None
+            self._result = result
+
+    @property
+    def result(self):
+        '''Returns the parsed json response, decoding the body on first access'''
+        if self._result is _UNPARSED:
+            self._result = json_loads(self._content)
+            self._content = None
+
+        return self._result
+
+    @property
+    def top_language(self):
+        '''Returns the most likely language code of a single detection, None if there is none'''
+        best = self.__best(self.result['results']) if self.is_success else None
+
+        return best and best['lang']
+
+    @property
+    def top_confidence(self):
+        '''Returns the confidence of the most likely language of a single detection'''
+        best = self.__best(self.result['results']) if self.is_success else None
+
+        return best and best['confidence']
+
+    @property
+    def top_languages(self):
+        '''Returns the most likely language code per text of a bulk detection'''
+        return [best and best['lang'] for best in map(self.__best, self.result['results'])] if self.is_success else None
+
+    @property
+    def top_confidences(self):
+        '''Returns the confidence of the most likely language per text of a bulk detection'''
+        return [best and best['confidence'] for best in map(self.__best, self.result['results'])] if self.is_success else None
+
+    def columns(self, use_numpy=None):
+        '''Returns the result of a bulk detection as LanguageColumns or ProfanityColumns
+
+        Parameters:
+            use_numpy (bool): return NumPy arrays, defaults to whether NumPy is installed
+        '''
+        from .columnar import LanguageColumns, ProfanityColumns
+
+        if not self.is_success:
+            return None
+
+        if 'scores' in self.result:
+            return ProfanityColumns.from_results(self.result['scores'], use_numpy)
+
+        return LanguageColumns.from_results(self.result['results'], use_numpy)
+
+    @staticmethod
+    def __best(candidates):
+        return max(candidates, key=itemgetter('confidence')) if candidates else None
 
     def raise_on_error(self):
         '''Call this method to raise a LinguinError after initializing the response'''
@@ -0,0 +1,256 @@
+"""Local stand-in for api.linguin.ai
+
+Serves /v2/detect/*, /v2/bulk_detect/*, /v2/status and /v2/languages over
+real sockets with HTTP/1.1 keep-alive, with configurable latency, jitter,
+error injection and payload limits. Detections are deterministic fakes.
+
+Run it with: python -m linguin.mock_server --port 8080
+"""
+import argparse
+import gzip
+import json
+import random
+import socket
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from .script import ScriptClassifier
+
+LANGUAGES = {
+    'de': ['German', 'Deutsch'],
+    'el': ['Greek', 'Ελληνικά'],
+    'en': ['English', 'English'],
+    'ja': ['Japanese', '日本語'],
+    'ko': ['Korean', '한국어'],
+    'th': ['Thai', 'ไทย']
+}
+PROFANE_WORDS = frozenset(['moron', 'idiot', 'stupid'])
+DECOMPRESS = {
+    'gzip': gzip.decompress,
+    'deflate': zlib.decompress
+}
+
+
+class MockLinguinServer:
+    """Threaded HTTP server imitating the Linguin API
+
+    Attributes:
+        - latency: float - seconds every request takes at least
+        - jitter: float - maximum random seconds added to latency
+        - rate_limit_rate: float - share of detections answered with 429 and Retry-After
+        - error_rate: float - share of detections answered with 503
+        - max_bulk_size: int - maximum number of texts per bulk request, more are answered with 400
+        - max_body_bytes: int - maximum request body size, larger bodies are answered with 413
+        - daily_limit: int - detections allowed in total, -1 for unlimited
+        - requests: int - requests handled so far
+        - connections: int - connections accepted so far
+        - detections: int - texts detected so far
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, rate_limit_rate=0.0, error_rate=0.0,
+                 max_bulk_size=1000, max_body_bytes=1024 * 1024, daily_limit=-1, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.max_bulk_size = max_bulk_size
+        self.max_body_bytes = max_body_bytes
+        self.daily_limit = daily_limit
+        self.requests = 0
+        self.connections = 0
+        self.detections = 0
+        self._random = random.Random(seed)
+        self._classifier = ScriptClassifier(confidence=0.99)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_uri(self):
+        host, port = self._httpd.server_address[:2]
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        '''Serves requests on a background thread'''
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='linguin-mock-server', daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def handle(self, method, path, headers, body):
+        '''Returns (status, extra headers, json or text body) of a request'''
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            roll = self._random.random()
+
+        if delay:
+            time.sleep(delay)
+
+        if path == '/v2/languages' and method == 'GET':
+            return 200, {'ETag': '"mock"'}, LANGUAGES
+
+        if not headers.get('Authorization', '').startswith('Bearer '):
+            return 401, {}, 'Missing API key.'
+
+        if path == '/v2/status' and method == 'GET':
+            return 200, {}, self._status()
+
+        kind = self._route(method, path)
+
+        if kind is None:
+            return 404, {}, 'Not found.'
+
+        if roll < self.rate_limit_rate:
+            return 429, {'Retry-After': '1'}, 'Rate limit exceeded.'
+
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 503, {}, 'Service unavailable.'
+
+        if len(body) > self.max_body_bytes:
+            return 413, {}, 'Payload too large.'
+
+        return self._detect(kind, path.startswith('/v2/bulk_detect/'), self._texts(headers, body))
+
+    def _route(self, method, path):
+        for prefix in ('/v2/detect/', '/v2/bulk_detect/'):
+            if method == 'POST' and path.startswith(prefix) and path[len(prefix):] in ('language', 'profanity'):
+                return path[len(prefix):]
+
+        return None
+
+    def _status(self):
+        with self._lock:
+            remaining = -1 if self.daily_limit < 0 else max(0, self.daily_limit - self.detections)
+
+            return {'daily_limit': self.daily_limit, 'detections_today': self.detections, 'remaining_today': remaining}
+
+    @staticmethod
+    def _texts(headers, body):
+        encoding = headers.get('Content-Encoding')
+
+        if encoding in DECOMPRESS:
+            body = DECOMPRESS[encoding](body)
+
+        if headers.get('Content-Type', '').startswith('application/json'):
+            texts = json.loads(body.decode('utf-8')).get('q')
+        else:
+            params = parse_qs(body.decode('ascii'))
+            texts = params.get('q[]', params.get('q'))
+
+        return [texts] if isinstance(texts, str) else texts or []
+
+    def _detect(self, kind, bulk, texts):
+        texts = [text.strip() for text in texts]
+
+        if not texts or not all(texts) or (not bulk and len(texts) != 1):
+            return 400, {}, 'Invalid query.'
+
+        if bulk and len(texts) > self.max_bulk_size:
+            return 400, {}, 'Too many texts.'
+
+        with self._lock:
+            if 0 <= self.daily_limit < self.detections + len(texts):
+                return 429, {}, 'Daily limit exceeded.'
+
+            self.detections += len(texts)
+
+        detect = self._language if kind == 'language' else self._profanity
+        results = [detect(text) for text in texts]
+
+        if kind == 'language':
+            return 200, {}, {'results': results} if bulk else {'results': results[0]}
+
+        return 200, {}, {'scores': results} if bulk else {'score': results[0]}
+
+    def _language(self, text):
+        return self._classifier.classify(text) or [{'lang': 'en', 'confidence': 0.9}, {'lang': 'de', 'confidence': 0.1}]
+
+    @staticmethod
+    def _profanity(text):
+        return 0.99 if PROFANE_WORDS.intersection(text.lower().split()) else 0.01
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # headers and body are written separately, without this delayed ACKs add ~40ms per response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        with self.server.mock._lock:
+            self.server.mock.connections += 1
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def do_POST(self):
+        self._respond('POST')
+
+    def _respond(self, method):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        status, headers, content = self.server.mock.handle(method, self.path, self.headers, body)
+
+        if isinstance(content, str):
+            payload, content_type = content.encode('utf-8'), 'text/plain; charset=utf-8'
+        else:
+            payload, content_type = json.dumps(content).encode('utf-8'), 'application/json'
+
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(payload)))
+
+            for name, value in headers.items():
+                self.send_header(name, value)
+
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client gave up waiting, e.g. after its deadline or a hedged request won
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local stand-in for api.linguin.ai')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds every request takes at least')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum random seconds added to the latency')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='share of detections answered with 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of detections answered with 503')
+    parser.add_argument('--max-bulk-size', type=int, default=1000)
+    parser.add_argument('--max-body-bytes', type=int, default=1024 * 1024, help='larger request bodies are answered with 413')
+    parser.add_argument('--daily-limit', type=int, default=-1)
+    args = parser.parse_args(argv)
+
+    server = MockLinguinServer(args.host, args.port, args.latency, args.jitter, args.rate_limit_rate, args.error_rate,
+                               args.max_bulk_size, args.max_body_bytes, args.daily_limit)
+    print('Serving the Linguin API on {uri}'.format(uri=server.base_uri))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""Spreading requests over several API keys"""
+import threading
+import time
+from collections import deque
+from .linguin import Linguin, QUOTA_EXCEEDED_MESSAGE
+from .linguin_response import LinguinResponse
+from .exceptions import LinguinAuthenticationError, LinguinQuotaExceededError, LinguinRateLimitError
+from .quota import QuotaTracker
+
+NO_KEYS_MESSAGE = 'None of the API keys is usable.'
+
+
+class KeyState:
+    """Health and quota of one API key of a LinguinPool
+
+    disabled and the 429 history are shared by the pool's worker threads,
+    the pool changes and reads them under its _keys_lock.
+
+    Attributes:
+        - api_key: str - the key
+        - quota: QuotaTracker - local accounting of the key's daily quota
+        - disabled: bool - the key was rejected by the server and is out of rotation
+    """
+
+    def __init__(self, api_key, resync_interval):
+        self.api_key = api_key
+        self.headers = {
+            'Authorization': 'Bearer ' + api_key
+        }
+        self.quota = QuotaTracker(resync_interval=resync_interval)
+        self.disabled = False
+        self._rate_limited_at = deque()
+
+    def recent_rate_limits(self, window):
+        '''Returns the number of 429 responses received in the last window seconds'''
+        oldest = time.monotonic() - window
+
+        while self._rate_limited_at and self._rate_limited_at[0] < oldest:
+            self._rate_limited_at.popleft()
+
+        return len(self._rate_limited_at)
+
+    def rate_limited(self):
+        self._rate_limited_at.append(time.monotonic())
+        self.quota.invalidate()
+
+
+class LinguinPool(Linguin):
+    """Client class for Linguin API spreading requests over several API keys
+
+    Every request, or every chunk of a bulk request, is sent with the usable
+    key with the most remaining quota and the fewest 429 responses in the last
+    rate_limit_window seconds. The quota of each key is tracked locally and
+    resynced from /status. A key rejected with 401 is taken out of rotation,
+    a key with no quota left is skipped until its next resync, and a request
+    rejected with 401 or 429 is retried with the next best key.
+
+    Accepts the same options as Linguin except api_key and quota.
+    """
+
+    def __init__(self, api_keys, resync_interval=300.0, rate_limit_window=60.0, **options):
+        '''
+        Parameters:
+            api_keys (array of strings): your Linguin API keys
+            resync_interval (float): seconds between /status calls per key
+            rate_limit_window (float): seconds a 429 response counts against a key
+        '''
+        if not api_keys:
+            raise ValueError('LinguinPool needs at least one API key')
+
+        super().__init__(api_keys[0], **options)
+        self.keys = [KeyState(api_key, resync_interval) for api_key in api_keys]
+        self.rate_limit_window = rate_limit_window
+        self._keys_lock = threading.Lock()
+
+    def status(self, raise_on_error=False):
+        '''Returns the summed up api usage status of all usable keys
+
+        Returns:
+            a LinguinResponse object containing
+            e.g. {'daily_limit': 20000, 'detections_today': 8000, 'remaining_today': 12000}
+            -1 if any key is unlimited
+        '''
+        totals = {'daily_limit': 0, 'detections_today': 0, 'remaining_today': 0}
+        response = LinguinResponse(error=LinguinAuthenticationError(401, NO_KEYS_MESSAGE))
+        synced = False
+
+        for state in self.keys:
+            if state.disabled:
+                continue
+
+            key_response = self._sync_key(state)
+
+            if not key_response.is_success:
+                response = response if synced else key_response
+                continue
+
+            synced = True
+
+            for field in totals:
+                value = key_response.result.get(field) or 0
+                totals[field] = -1 if value < 0 or totals[field] < 0 else totals[field] + value
+
+        if synced:
+            response = LinguinResponse(result=totals)
+
+        if raise_on_error or self.raise_on_error:
+            response.raise_on_error()
+
+        return response
+
+    def _request(self, method, path, payload=None, headers=None):
+        '''Sends a request with the best key, failing over to the next key on 401 and 429'''
+        count = self._count_texts(payload)
+        tried = set()
+        rate_limited = None
+
+        while True:
+            state = self._select_key(count, tried)
+
+            if state is None:
+                return self._no_key_response() if rate_limited is None else rate_limited
+
+            tried.add(state.api_key)
+            state.quota.reserve(count)
+
+            try:
+                response = super()._request(method, path, payload, state.headers)
+            except BaseException:
+                state.quota.release(count)
+                raise
+
+            self._observe(state, response, count)
+
+            if isinstance(response.error, LinguinRateLimitError):
+                # a transient 429 of the last key tried is reported as is, so that callers back off and retry
+                rate_limited = response
+            elif not isinstance(response.error, LinguinAuthenticationError):
+                return response
+
+    def _select_key(self, count, tried):
+        with self._keys_lock:
+            candidates = [state for state in self.keys if not state.disabled and state.api_key not in tried]
+
+        for state in candidates:
+            if state.quota.needs_sync():
+                self._sync_key(state)
+
+        candidates = [state for state in candidates if not state.disabled and state.quota.can_send(count)]
+
+        if not candidates:
+            return None
+
+        with self._keys_lock:
+            return max(candidates, key=self._rank)
+
+    def _rank(self, state):
+        remaining = state.quota.remaining_today
+        remaining = float('inf') if remaining is None or state.quota.unlimited else remaining
+
+        return -state.recent_rate_limits(self.rate_limit_window), remaining
+
+    def _sync_key(self, state):
+        response = super()._request('GET', 'status', headers=state.headers)
+
+        if response.is_success:
+            state.quota.update(response.result)
+        else:
+            state.quota.sync_failed()
+            self._observe(state, response, 0)
+
+        return response
+
+    def _hedge_quota(self, headers):
+        return next((state.quota for state in self.keys if state.headers is headers), None)
+
+    def _observe(self, state, response, count):
+        if count and not response.is_success:
+            state.quota.release(count)
+
+        with self._keys_lock:
+            if isinstance(response.error, LinguinAuthenticationError):
+                state.disabled = True
+            elif isinstance(response.error, LinguinRateLimitError):
+                state.rate_limited()
+
+    def _no_key_response(self):
+        with self._keys_lock:
+            disabled = all(state.disabled for state in self.keys)
+
+        if disabled:
+            return LinguinResponse(error=LinguinAuthenticationError(401, NO_KEYS_MESSAGE))
+
+        return LinguinResponse(error=LinguinQuotaExceededError(429, QUOTA_EXCEEDED_MESSAGE))
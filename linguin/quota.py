@@ -0,0 +1,100 @@
+"""Local accounting of the daily detection quota"""
+import threading
+import time
+
+
+class QuotaTracker:
+    """Counts detections sent by a client and resyncs with /status occasionally
+
+    Every text sent to a detect endpoint counts as one detection, texts
+    answered from a cache or deduplicated are not sent and not counted.
+
+    Attributes:
+        - resync_interval: float - seconds between /status calls
+        - enforce: bool - fail fast with LinguinQuotaExceededError instead of sending
+          requests that would exceed the remaining quota
+        - daily_limit: int - daily limit of the key, -1 for unlimited, None before the first sync
+        - unlimited: bool - the key has no daily limit
+        - detections_today: int - detections used today including those counted locally
+    """
+
+    def __init__(self, resync_interval=300.0, enforce=False):
+        self.resync_interval = resync_interval
+        self.enforce = enforce
+        self.daily_limit = None
+        self.detections_today = None
+        self.unlimited = False
+        self._remaining = None
+        self._synced_at = None
+        self._syncing = False
+        self._lock = threading.Lock()
+
+    @property
+    def remaining_today(self):
+        '''Returns the detections left today, -1 for unlimited, None before the first sync'''
+        if self.unlimited:
+            return -1
+
+        # the local count goes below zero when more was sent than the quota allowed
+        return None if self._remaining is None else max(0, self._remaining)
+
+    def can_send(self, count):
+        '''Returns whether count detections fit in the remaining quota'''
+        remaining = self._remaining
+
+        return self.unlimited or remaining is None or remaining >= count
+
+    def needs_sync(self):
+        '''Returns True to exactly one caller once a resync is due'''
+        with self._lock:
+            due = self._synced_at is None or time.monotonic() - self._synced_at >= self.resync_interval
+
+            if not due or self._syncing:
+                return False
+
+            self._syncing = True
+            return True
+
+    def update(self, status):
+        '''Replaces local counts with a /status result'''
+        with self._lock:
+            self.daily_limit = status.get('daily_limit')
+            self.detections_today = status.get('detections_today') or 0
+            remaining = status.get('remaining_today')
+            self.unlimited = self.daily_limit == -1 or remaining == -1
+            self._remaining = None if self.unlimited else remaining
+            self._synced_at = time.monotonic()
+            self._syncing = False
+
+    def invalidate(self):
+        '''Makes the next needs_sync() call return True'''
+        with self._lock:
+            self._synced_at = None
+
+    def sync_failed(self):
+        with self._lock:
+            self._synced_at = time.monotonic()
+            self._syncing = False
+
+    def reserve(self, count):
+        '''Counts count detections, returns False instead when enforcing and they don't fit'''
+        with self._lock:
+            if self.enforce and not self.can_send(count):
+                return False
+
+            if self._remaining is not None:
+                self._remaining -= count
+
+            if self.detections_today is not None:
+                self.detections_today += count
+
+            return True
+
+    def release(self, count):
+        '''Returns count reserved detections that were not used'''
+        with self._lock:
+            if self._remaining is not None:
+                self._remaining += count
+
+            if self.detections_today is not None:
+                self.detections_today -= count
@@ -0,0 +1,82 @@
+"""Shortening of long texts before language detection"""
+import re
+import threading
+import unicodedata
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SAMPLES = ('head', 'middle', 'tail', 'spread')
+# one character of each of the three parts and the two spaces joining them
+SPREAD_MIN_CHARS = 5
+
+
+class TextReducer:
+    """Cuts texts down to a representative sample of at most max_chars characters
+
+    A few hundred characters are enough to tell the language of a document,
+    sending less of it saves upload bandwidth and server time.
+
+    Attributes:
+        - max_chars: int - maximum length of a reduced text, at least 1 and at least 5 to spread
+        - sample: str - part of a long text to keep, 'head', 'middle', 'tail' or
+          'spread' for equal parts of the head, middle and tail
+        - collapse_whitespace: bool - replace runs of whitespace by a single space
+        - normalization: str - Unicode normalization form, e.g. 'NFC', None to keep texts as they are
+        - bytes_saved: int - UTF-8 bytes removed from all texts reduced so far
+    """
+
+    def __init__(self, max_chars=500, sample='head', collapse_whitespace=True, normalization='NFC'):
+        if sample not in SAMPLES:
+            raise ValueError('sample must be one of {samples}'.format(samples=', '.join(SAMPLES)))
+
+        if max_chars < 1:
+            raise ValueError('max_chars must be at least 1')
+
+        if sample == 'spread' and max_chars < SPREAD_MIN_CHARS:
+            raise ValueError('max_chars must be at least {minimum} to spread'.format(minimum=SPREAD_MIN_CHARS))
+
+        self.max_chars = max_chars
+        self.sample = sample
+        self.collapse_whitespace = collapse_whitespace
+        self.normalization = normalization
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def reduce(self, text):
+        '''Returns the reduced text and adds the bytes removed to bytes_saved'''
+        reduced = text
+
+        if self.collapse_whitespace:
+            reduced = WHITESPACE_PATTERN.sub(' ', reduced)
+
+        if len(reduced) > self.max_chars:
+            reduced = self._sample(reduced)
+
+        if self.normalization:
+            reduced = unicodedata.normalize(self.normalization, reduced)
+
+        if reduced != text:
+            saved = len(text.encode('utf-8')) - len(reduced.encode('utf-8'))
+
+            with self._lock:
+                self.bytes_saved += saved
+
+        return reduced
+
+    def _sample(self, text):
+        size = self.max_chars
+
+        if self.sample == 'head':
+            return text[:size]
+
+        if self.sample == 'tail':
+            return text[-size:]
+
+        if self.sample == 'middle':
+            start = (len(text) - size) // 2
+            return text[start:start + size]
+
+        part = (size - 2) // 3
+        middle = (len(text) - part) // 2
+        tail = size - 2 - 2 * part
+
+        return ' '.join((text[:part], text[middle:middle + part], text[len(text) - tail:]))
@@ -0,0 +1,135 @@
+"""Retry policies and client-side rate limiting"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+_DEFAULT_BUDGET = object()
+
+
+class RetryBudget:
+    """Caps retries to a share of the requests sent
+
+    Every first attempt deposits ratio tokens, every retry withdraws one. The
+    balance starts at and never exceeds max_tokens, so short bursts of errors
+    are retried while a sustained outage does not multiply the load.
+    """
+
+    def __init__(self, ratio=0.2, max_tokens=10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        '''Returns whether a retry may be sent'''
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, Retry-After support and a retry budget
+
+    Attributes:
+        - max_retries: int - retries after the first attempt
+        - backoff: float - base delay in seconds, doubled with every retry
+        - max_backoff: float - upper bound of a single delay in seconds
+        - retry_statuses: tuple - HTTP status codes worth retrying
+        - respect_retry_after: bool - wait as long as the server's Retry-After header asks
+        - budget: RetryBudget - shared limit of retries, defaults to a RetryBudget(), None for no limit
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30.0, retry_statuses=(429, 500, 502, 503, 504),
+                 respect_retry_after=True, budget=_DEFAULT_BUDGET):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.budget = RetryBudget() if budget is _DEFAULT_BUDGET else budget
+
+    def should_retry(self, attempt, status=None):
+        '''Returns whether the failed attempt (0 for the first one) should be retried'''
+        if attempt >= self.max_retries or (status is not None and status not in self.retry_statuses):
+            return False
+
+        return self.budget is None or self.budget.withdraw()
+
+    def delay(self, attempt, retry_after=None):
+        '''Returns the seconds to wait before the next attempt'''
+        wait = parse_retry_after(retry_after) if self.respect_retry_after else None
+
+        if wait is not None:
+            return min(self.max_backoff, wait) + random.uniform(0, self.backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    '''Returns the seconds requested by a Retry-After header, in seconds or as HTTP date'''
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of requests
+
+    Share one bucket between clients using the same API key to stay under the
+    plan's rate instead of collecting 429 responses.
+
+    Attributes:
+        - rate: float - tokens added per second
+        - capacity: float - maximum burst size, defaults to rate but at least one token
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1, timeout=None):
+        '''Blocks until tokens are available and takes them
+
+        Returns False without taking tokens if they won't be available within timeout seconds.
+        '''
+        if tokens > self.capacity:
+            raise ValueError('cannot acquire {tokens} tokens from a bucket of capacity {capacity}'.format(tokens=tokens, capacity=self.capacity))
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+
+            time.sleep(wait)
@@ -0,0 +1,124 @@
+"""Local language pre-classification by Unicode script"""
+import re
+from bisect import bisect_right
+
+URL_PATTERN = re.compile(r'\S+://\S+|www\.\S+|\S+@\S+\.\S+')
+
+# (first, last, script) code point ranges of the scripts the classifier knows
+SCRIPT_RANGES = sorted([
+    (0x0370, 0x03FF, 'Greek'),
+    (0x1F00, 0x1FFF, 'Greek'),
+    (0x0530, 0x058F, 'Armenian'),
+    (0x0A00, 0x0A7F, 'Gurmukhi'),
+    (0x0A80, 0x0AFF, 'Gujarati'),
+    (0x0B80, 0x0BFF, 'Tamil'),
+    (0x0C00, 0x0C7F, 'Telugu'),
+    (0x0C80, 0x0CFF, 'Kannada'),
+    (0x0D00, 0x0D7F, 'Malayalam'),
+    (0x0D80, 0x0DFF, 'Sinhala'),
+    (0x0E00, 0x0E7F, 'Thai'),
+    (0x0E80, 0x0EFF, 'Lao'),
+    (0x10A0, 0x10FF, 'Georgian'),
+    (0x2D00, 0x2D2F, 'Georgian'),
+    (0x1100, 0x11FF, 'Hangul'),
+    (0x3130, 0x318F, 'Hangul'),
+    (0xA960, 0xA97F, 'Hangul'),
+    (0xAC00, 0xD7FF, 'Hangul'),
+    (0x1780, 0x17FF, 'Khmer'),
+    (0x3040, 0x30FF, 'Kana'),
+    (0x31F0, 0x31FF, 'Kana'),
+    (0xFF66, 0xFF9F, 'Kana'),
+    (0x3400, 0x4DBF, 'Han'),
+    (0x4E00, 0x9FFF, 'Han'),
+    (0xF900, 0xFAFF, 'Han'),
+])
+RANGE_STARTS = [first for first, _, _ in SCRIPT_RANGES]
+
+# scripts used by exactly one language the API detects
+SCRIPT_LANGUAGES = {
+    'Greek': 'el',
+    'Armenian': 'hy',
+    'Gurmukhi': 'pa',
+    'Gujarati': 'gu',
+    'Tamil': 'ta',
+    'Telugu': 'te',
+    'Kannada': 'kn',
+    'Malayalam': 'ml',
+    'Sinhala': 'si',
+    'Thai': 'th',
+    'Lao': 'lo',
+    'Georgian': 'ka',
+    'Hangul': 'ko',
+    'Khmer': 'km',
+    'Kana': 'ja'
+}
+
+# scripts Han characters may be mixed with without making a text ambiguous
+HAN_COMPANIONS = ('Hangul', 'Kana')
+
+
+def script_of(char):
+    '''Returns the script of a letter from SCRIPT_RANGES, None for any other script'''
+    code_point = ord(char)
+    position = bisect_right(RANGE_STARTS, code_point) - 1
+
+    if position >= 0 and code_point <= SCRIPT_RANGES[position][1]:
+        return SCRIPT_RANGES[position][2]
+
+    return None
+
+
+class ScriptClassifier:
+    """Decides the language of texts written in a single unambiguous script
+
+    Hangul is Korean, Kana is Japanese (also when mixed with Han characters),
+    Thai, Greek and the other scripts in SCRIPT_LANGUAGES have one language
+    each. Texts without any letters once URLs and e-mail addresses are
+    removed, e.g. numbers or emoji, have no language. Everything else is
+    ambiguous and left to the API.
+
+    Attributes:
+        - confidence: float - confidence reported for local decisions
+    """
+
+    def __init__(self, confidence=1.0):
+        self.confidence = confidence
+
+    def classify(self, text):
+        '''Returns the language candidates of text, None if the API has to decide
+
+        e.g. [{'lang': 'ko', 'confidence': 1.0}], or [] for texts without letters
+        '''
+        scripts = set()
+
+        for char in URL_PATTERN.sub(' ', text):
+            if not char.isalpha():
+                continue
+
+            script = script_of(char)
+
+            if script is None:
+                return None
+
+            scripts.add(script)
+
+        if not scripts:
+            return []
+
+        language = self._language(scripts)
+
+        return None if language is None else [{'lang': language, 'confidence': self.confidence}]
+
+    @staticmethod
+    def _language(scripts):
+        others = scripts - {'Han'}
+
+        if len(others) != 1:
+            return None
+
+        script = others.pop()
+
+        if 'Han' in scripts and script not in HAN_COMPANIONS:
+            return None
+
+        return SCRIPT_LANGUAGES.get(script)
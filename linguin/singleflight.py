@@ -0,0 +1,44 @@
+"""Coalescing of concurrent identical calls"""
+import threading
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time
+
+    Threads calling do() with a key that is already in flight wait for the
+    running call and receive its result instead of starting their own.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, timeout=None):
+        '''Returns fn() or the result of the identical call already in flight
+
+        Waiting for a call in flight raises concurrent.futures.TimeoutError after timeout seconds.
+        '''
+        from concurrent.futures import Future
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(timeout)
+
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return result
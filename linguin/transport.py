@@ -0,0 +1,120 @@
+"""Pluggable HTTP transports
+
+A transport sends the HTTP requests of a client. The built-in transports are
+registered by name and their modules, with the HTTP library they wrap, are
+imported only when a client first needs them, so importing linguin stays cheap:
+
+    - 'requests': requests.Session with a pool of keep-alive connections
+    - 'urllib': pooled http.client connections, no dependencies
+    - 'aiohttp': aiohttp.ClientSession, for AsyncLinguin
+"""
+import importlib
+import importlib.util
+from abc import ABC, abstractmethod
+from urllib.parse import urlencode
+
+TRANSPORTS = {
+    'requests': ('linguin.transport_requests', 'RequestsTransport'),
+    'urllib': ('linguin.transport_urllib', 'UrllibTransport'),
+    'aiohttp': ('linguin.transport_aiohttp', 'AiohttpTransport')
+}
+
+
+class PoolTimeout(TimeoutError):
+    """No pooled connection became free within the pool timeout"""
+
+
+class Transport(ABC):
+    """Interface of the transports used by Linguin
+
+    request() takes form payloads as dicts and encodes them, other bodies are
+    sent as bytes. Timeouts are a number or a (connect, read) tuple in seconds.
+    Linguin passes a pool_timeout only while a deadline is set, a transport
+    waiting longer than it for a free connection raises PoolTimeout.
+
+    Attributes:
+        - errors: tuple - exception classes of failed connections and timeouts,
+          these are retried by a RetryPolicy
+    """
+
+    errors = (OSError,)
+
+    def __init__(self, pool_size=10):
+        self.pool_size = pool_size
+
+    @abstractmethod
+    def request(self, method, url, data=None, headers=None, timeout=None, pool_timeout=None):
+        '''Sends a request and returns a response with status_code, headers, content and json()'''
+
+    def close(self):
+        '''Closes all pooled connections'''
+
+
+class AsyncTransport(ABC):
+    """Interface of the transports used by AsyncLinguin, request() and close() are coroutines"""
+
+    def __init__(self, pool_size=10):
+        self.pool_size = pool_size
+
+    @abstractmethod
+    async def request(self, method, url, data=None, headers=None, timeout=None):
+        '''Sends a request and returns a fully read response like Transport.request()'''
+
+    async def close(self):
+        pass
+
+
+def body_size(data):
+    '''Returns the size in bytes of a request body as the transports send it'''
+    if isinstance(data, dict):
+        return len(urlencode(data, doseq=True))
+
+    return len(data) if data else 0
+
+
+class TransportResponse:
+    """Fully read HTTP response
+
+    Attributes:
+        - status_code: int - HTTP status
+        - headers: mapping with case-insensitive get()
+        - content: bytes - response body
+    """
+
+    __slots__ = ('status_code', 'headers', 'content')
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        import json
+
+        return json.loads(self.content)
+
+    def close(self):
+        pass
+
+
+def default_transport():
+    '''Returns the name of the default transport, requests when it is installed'''
+    return 'requests' if importlib.util.find_spec('requests') is not None else 'urllib'
+
+
+def load_transport(name):
+    '''Imports and returns the transport class registered as name'''
+    if name not in TRANSPORTS:
+        raise ValueError('transport must be one of {names}'.format(names=', '.join(TRANSPORTS)))
+
+    module, cls = TRANSPORTS[name]
+
+    return getattr(importlib.import_module(module), cls)
+
+
+def create_transport(transport, pool_size):
+    '''Returns transport if it's a transport instance, otherwise a new transport of the given name or the default one'''
+    if transport is not None and not isinstance(transport, str):
+        return transport
+
+    return load_transport(transport or default_transport())(pool_size)
@@ -0,0 +1,35 @@
+"""Asyncio transport sending requests with aiohttp"""
+import aiohttp
+from .transport import AsyncTransport, TransportResponse
+
+
+class AiohttpTransport(AsyncTransport):
+    """aiohttp.ClientSession keeping up to pool_size connections alive, created on the first request"""
+
+    errors = (aiohttp.ClientError, TimeoutError)
+
+    def __init__(self, pool_size=10):
+        super().__init__(pool_size)
+        self.session = None
+
+    async def request(self, method, url, data=None, headers=None, timeout=None):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size))
+
+        async with self.session.request(method, url, data=data, headers=headers, timeout=client_timeout(timeout)) as response:
+            content = await response.read()
+
+        return TransportResponse(response.status, response.headers, content)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+def client_timeout(timeout):
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    return aiohttp.ClientTimeout(total=timeout)
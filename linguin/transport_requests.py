@@ -0,0 +1,36 @@
+"""Transport sending requests with the requests library"""
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .transport import PoolTimeout, Transport
+
+
+class RequestsTransport(Transport):
+    """requests.Session whose adapters keep up to pool_size connections alive
+
+    Attributes:
+        - session: requests.Session - the pooled session
+    """
+
+    errors = (requests.ConnectionError, requests.Timeout, TimeoutError)
+
+    def __init__(self, pool_size=10):
+        super().__init__(pool_size)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # the adapter pool blocks without a timeout, requests wait for a slot here instead
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def request(self, method, url, data=None, headers=None, timeout=None, pool_timeout=None):
+        if not self._slots.acquire(timeout=pool_timeout):
+            raise PoolTimeout('No pooled connection became free in time.')
+
+        try:
+            return self.session.request(method, url, data=data, headers=headers, timeout=timeout)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,107 @@
+"""Transport sending requests over pooled http.client connections, without dependencies"""
+import http.client
+import threading
+from urllib.parse import urlencode, urlsplit
+from .transport import PoolTimeout, Transport, TransportResponse
+
+# errors of a kept-alive connection the server closed in the meantime, the request is sent again on a new one
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class UrllibTransport(Transport):
+    """Keeps up to pool_size keep-alive connections per host, further requests wait for a free one"""
+
+    errors = (OSError, http.client.HTTPException)
+
+    def __init__(self, pool_size=10):
+        super().__init__(pool_size)
+        self._idle = {}
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def request(self, method, url, data=None, headers=None, timeout=None, pool_timeout=None):
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path + ('?' + parts.query if parts.query else '')
+        headers = dict(headers or {})
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+        if isinstance(data, dict):
+            data = urlencode(data, doseq=True).encode('ascii')
+            headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+
+        if not self._slots.acquire(timeout=pool_timeout):
+            raise PoolTimeout('No pooled connection became free in time.')
+
+        try:
+            connection = self._checkout(origin)
+
+            try:
+                return self._send(connection, origin, method, path, data, headers, connect_timeout, read_timeout)
+            except STALE_CONNECTION_ERRORS:
+                if connection is None:
+                    raise
+
+            return self._send(None, origin, method, path, data, headers, connect_timeout, read_timeout)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _send(self, connection, origin, method, path, data, headers, connect_timeout, read_timeout):
+        '''Sends the request on connection or a new one and keeps the connection if the server does'''
+        if connection is None:
+            connection = self._connect(origin, connect_timeout)
+
+        try:
+            connection.sock.settimeout(read_timeout)
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(origin, connection)
+
+        return TransportResponse(response.status, response.headers, content)
+
+    def _connect(self, origin, timeout):
+        scheme, host, port = origin
+
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._get_ssl_context())
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+        connection.connect()
+
+        return connection
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            import ssl
+            self._ssl_context = ssl.create_default_context()
+
+        return self._ssl_context
+
+    def _checkout(self, origin):
+        '''Returns an idle connection to origin, None if there is none'''
+        with self._lock:
+            connections = self._idle.get(origin)
+
+            return connections.pop() if connections else None
+
+    def _checkin(self, origin, connection):
+        with self._lock:
+            self._idle.setdefault(origin, []).append(connection)
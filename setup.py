@@ -28,6 +28,16 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=["linguin"],
-    python_requires=">=3.6",
-    install_requires=['requests']
+    python_requires=">=3.7",
+    install_requires=['requests'],
+    entry_points={
+        'console_scripts': ['linguin=linguin.cli:main']
+    },
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+        'arrow': ['numpy', 'pyarrow']
+    }
 )
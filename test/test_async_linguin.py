@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from faker import Faker
+from faker.providers import misc
+from linguin import AsyncLinguin
+from linguin import LinguinInputError, LinguinInternalError
+
+class TestAsyncLinguin(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+        app = web.Application()
+        app.router.add_post('/v2/detect/language', self.detect_language)
+        app.router.add_post('/v2/detect/profanity', self.detect_profanity)
+        app.router.add_post('/v2/bulk_detect/profanity', self.bulk_detect_profanity)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_uri = str(self.server.make_url('')).rstrip('/')
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def detect_language(self, request):
+        form = await request.post()
+        self.calls.append((request.headers, form))
+
+        if form['q'] == 'down':
+            return web.Response(status=503, text='down')
+
+        return web.json_response({'results': [{'lang': 'en', 'confidence': 1.0}]})
+
+    async def detect_profanity(self, request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return web.json_response({'score': 0.0})
+
+    async def bulk_detect_profanity(self, request):
+        self.calls.append((request.headers, await request.post()))
+        return web.json_response({'scores': [1.0, 0.0]})
+
+    async def test_detect_success(self):
+        async with AsyncLinguin(self.api_token, base_uri=self.base_uri) as linguin:
+            response = await linguin.detect_language(' test ')
+
+        assert response.is_success == True
+        assert response.result == {'results': [{'lang': 'en', 'confidence': 1.0}]}
+        headers, form = self.calls[0]
+        assert form['q'] == 'test'
+        assert headers['Authorization'] == 'Bearer {token}'.format(token=self.api_token)
+
+    async def test_bulk_success(self):
+        async with AsyncLinguin(self.api_token, base_uri=self.base_uri) as linguin:
+            response = await linguin.bulk_detect_profanity(['a', 'b'])
+
+        assert response.result == {'scores': [1.0, 0.0]}
+        headers, form = self.calls[0]
+        assert form.getall('q[]') == ['a', 'b']
+
+    async def test_errors(self):
+        async with AsyncLinguin(self.api_token, base_uri=self.base_uri) as linguin:
+            response = await linguin.detect_language('down')
+            local = await linguin.bulk_detect_profanity(['', 'test'])
+
+        assert type(response.error) is LinguinInternalError
+        assert response.error.message == 'down'
+        assert type(local.error) is LinguinInputError
+
+    async def test_bounded_concurrency(self):
+        async with AsyncLinguin(self.api_token, max_concurrency=3, base_uri=self.base_uri) as linguin:
+            responses = await asyncio.gather(*[linguin.detect_profanity('text') for _ in range(10)])
+
+        assert all(response.is_success for response in responses)
+        assert self.peak == 3
+
+    async def test_connections_follow_concurrency(self):
+        async with AsyncLinguin(self.api_token, max_concurrency=30, base_uri=self.base_uri) as linguin:
+            responses = await asyncio.gather(*[linguin.detect_profanity('text') for _ in range(30)])
+
+        assert all(response.is_success for response in responses)
+        assert linguin.pool_size == 30
+        assert self.peak == 30
@@ -0,0 +1,68 @@
+import unittest
+from urllib.parse import parse_qs
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInternalError
+from linguin.chunking import chunk_texts, form_size, json_size
+from linguin.encoding import RequestEncoder
+from linguin.mock_server import MockLinguinServer
+
+def echo_language(request):
+    texts = parse_qs(request.body)['q[]']
+    return (200, {}, '{"results": [%s]}' % ', '.join('[{"lang": "%s", "confidence": 1.0}]' % text for text in texts))
+
+class TestBulkChunking(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/bulk_detect/language'
+
+    def test_chunk_texts(self):
+        assert list(chunk_texts(['a', 'b', 'c'], 2, 1000)) == [['a', 'b'], ['c']]
+        assert list(chunk_texts(['aaaa', 'bbbb', 'c'], 10, 26)) == [['aaaa', 'bbbb'], ['c']]
+        assert list(chunk_texts(['a' * 100, 'b'], 10, 25)) == [['a' * 100], ['b']]
+
+    def test_chunk_size_of_encoded_texts(self):
+        assert form_size('駅') == len('%E9%A7%85') + 9
+        assert json_size('駅') == len('"駅"'.encode('utf-8')) + 2
+        assert list(chunk_texts(['駅駅', '駅駅'], 10, 50)) == [['駅駅'], ['駅駅']]
+        assert list(chunk_texts(['駅駅', '駅駅'], 10, 50, json_size)) == [['駅駅', '駅駅']]
+
+    def test_cjk_texts_fit_the_server_limit(self):
+        texts = ['{index} {text}'.format(index=index, text='駅はどこですか' * 40) for index in range(1000)]
+
+        for encoder in (RequestEncoder(), RequestEncoder(format='json')):
+            with MockLinguinServer() as server:
+                linguin = Linguin(self.api_token, base_uri=server.base_uri, encoder=encoder)
+                response = linguin.bulk_detect_language(texts)
+                linguin.close()
+
+            assert response.is_success == True
+            assert len(response.result['results']) == 1000
+
+    @responses.activate
+    def test_chunks_merged_in_order(self):
+        responses.add_callback(responses.POST, self.url, callback=echo_language)
+        texts = ['t{}'.format(index) for index in range(25)]
+        linguin = Linguin(self.api_token, max_batch_size=4, max_workers=3)
+
+        response = linguin.bulk_detect_language(texts)
+
+        assert response.is_success == True
+        assert [result[0]['lang'] for result in response.result['results']] == texts
+        assert len(responses.calls) == 7
+
+    @responses.activate
+    def test_chunk_error(self):
+        responses.add(responses.POST, self.url, json={'results': [[], []]}, status=200)
+        responses.add(responses.POST, self.url, body='down', status=503)
+
+        linguin = Linguin(self.api_token, max_batch_size=2, max_workers=1)
+        response = linguin.bulk_detect_language(['a', 'b', 'c', 'd'])
+
+        assert response.is_success == False
+        assert type(response.error) is LinguinInternalError
+        assert response.result == None
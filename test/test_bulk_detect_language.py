@@ -11,7 +11,7 @@ class TestBulkDetectLanguage(unittest.TestCase):
         self.faker.add_provider(misc)
         self.api_token = self.faker.uuid4()
         self.linguin = Linguin(self.api_token)
-        self.input_texts = self.faker.words()
+        self.input_texts = self.faker.words(unique=True)
         self.url = 'https://api.linguin.ai/v2/bulk_detect/language'
 
     @responses.activate
@@ -0,0 +1,86 @@
+import itertools
+import os
+import tempfile
+import unittest
+from unittest import mock
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.cache import MemoryCache, SQLiteCache
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/language'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/language'
+
+    def test_memory_cache_lru_and_ttl(self):
+        cache = MemoryCache(max_size=2, ttl=10)
+        cache.set_many({'a': 1, 'b': 2})
+        cache.get_many(['a'])
+        cache.set_many({'c': 3})
+
+        assert cache.get_many(['a', 'b', 'c']) == {'a': 1, 'c': 3}
+
+        with mock.patch('time.monotonic', return_value=float('inf')):
+            assert cache.get_many(['a', 'c']) == {}
+
+    def test_sqlite_cache_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.db')
+            cache = SQLiteCache(path, max_size=2)
+            cache.set_many({'a': [{'lang': 'en', 'confidence': 1.0}], 'b': 0.5})
+            cache.get_many(['a'])
+            cache.set_many({'c': 0.1})
+            cache.close()
+
+            cache = SQLiteCache(path, ttl=60)
+            assert cache.get_many(['a', 'b', 'c']) == {'a': [{'lang': 'en', 'confidence': 1.0}], 'c': 0.1}
+            cache.close()
+
+    def test_sqlite_cache_evicts_beyond_max_size(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch('time.time', side_effect=itertools.count()):
+            cache = SQLiteCache(os.path.join(directory, 'cache.db'), max_size=3, ttl=3600)
+            cache.set_many({'a': 1, 'b': 2, 'c': 3})
+            cache.set_many({'a': 4})
+            assert len(cache) == 3
+
+            cache.set_many({'d': 5, 'e': 6})
+            assert cache.get_many(['a', 'b', 'c', 'd', 'e']) == {'a': 4, 'd': 5, 'e': 6}
+            cache.close()
+
+            cache = SQLiteCache(os.path.join(directory, 'cache.db'), max_size=3)
+            cache.set_many({'f': 7})
+            assert len(cache) == 3
+            cache.close()
+
+    @responses.activate
+    def test_detect_cached(self):
+        successful_response = {'results': [{'lang': 'en', 'confidence': 1.0}]}
+        responses.add(responses.POST, self.url, json=successful_response, status=200)
+        linguin = Linguin(self.api_token, cache=MemoryCache())
+
+        first = linguin.detect_language('test')
+        second = linguin.detect_language(' test ')
+
+        assert first.result == second.result == successful_response
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_bulk_sends_only_misses(self):
+        responses.add(responses.POST, self.url, json={'results': [{'lang': 'de', 'confidence': 1.0}]}, status=200)
+        responses.add(responses.POST, self.bulk_url, json={'results': [[{'lang': 'en', 'confidence': 1.0}]]}, status=200)
+        linguin = Linguin(self.api_token, cache=MemoryCache())
+
+        linguin.detect_language('Bahnhof')
+        response = linguin.bulk_detect_language(['Bahnhof', 'test'])
+
+        assert response.result == {'results': [[{'lang': 'de', 'confidence': 1.0}], [{'lang': 'en', 'confidence': 1.0}]]}
+        assert responses.calls[1].request.body == 'q%5B%5D=test'
+
+        response = linguin.bulk_detect_language(['test', 'Bahnhof'])
+        assert response.result['results'][0] == [{'lang': 'en', 'confidence': 1.0}]
+        assert len(responses.calls) == 2
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from linguin.cli import main
+from linguin.mock_server import MockLinguinServer
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, 'data.jsonl')
+        self.output = os.path.join(self.directory.name, 'results.jsonl')
+        self.server = MockLinguinServer(daily_limit=4).start()
+
+        with open(self.input, 'w', encoding='utf-8') as file:
+            for text in ['hello', 'you moron', '', 'สวัสดี', 'world', 'idiot']:
+                file.write(json.dumps({'id': text, 'text': text}) + '\n')
+
+    def tearDown(self):
+        self.server.stop()
+        self.directory.cleanup()
+
+    def run_cli(self, *extra):
+        argv = ['detect', 'profanity', '--in', self.input, '--out', self.output, '--api-key', 'key',
+                '--base-uri', self.server.base_uri, '--batch-size', '2', '--concurrency', '1', '--retries', '0',
+                '--checkpoint-every', '1'] + list(extra)
+
+        with mock.patch('sys.stderr'):
+            return main(argv)
+
+    def test_resumes_without_resending(self):
+        assert self.run_cli() == 1
+        assert os.path.exists(self.output + '.checkpoint')
+
+        self.server.daily_limit = -1
+        assert self.run_cli() == 0
+        assert not os.path.exists(self.output + '.checkpoint')
+
+        with open(self.output, encoding='utf-8') as file:
+            records = [json.loads(line) for line in file]
+
+        assert [record['id'] for record in records] == ['hello', 'you moron', '', 'สวัสดี', 'world', 'idiot']
+        assert [record['linguin'] for record in records] == [0.01, 0.99, None, 0.01, 0.01, 0.99]
+        assert self.server.detections == 5
+
+    def test_requires_api_key(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            assert self.run_cli('--api-key', '') == 2
+
+    def test_malformed_input_is_reported(self):
+        self.server.daily_limit = -1
+
+        with open(self.input, 'a', encoding='utf-8') as file:
+            file.write('{"text": "broken\n')
+
+        assert self.run_cli() == 1
+
+        with open(self.output + '.checkpoint', encoding='utf-8') as file:
+            assert json.load(file)['records'] >= 4
+
+    def test_connection_errors_are_reported(self):
+        unreachable = MockLinguinServer().start()
+        unreachable.stop()
+
+        assert self.run_cli('--base-uri', unreachable.base_uri) == 1
+        assert os.path.exists(self.output + '.checkpoint')
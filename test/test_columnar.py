@@ -0,0 +1,53 @@
+import math
+import unittest
+import numpy
+from linguin import LinguinResponse, LinguinInputError
+from linguin.columnar import LanguageColumns, ProfanityColumns
+
+class FakeResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.results = [
+            [{'lang': 'en', 'confidence': 0.9}, {'lang': 'de', 'confidence': 0.1}],
+            [{'lang': 'de', 'confidence': 0.4}],
+            [],
+            [{'lang': 'en', 'confidence': 0.7}]
+        ]
+
+    def test_language_columns(self):
+        for use_numpy in (True, False):
+            columns = LanguageColumns.from_results(self.results, use_numpy=use_numpy)
+
+            assert list(columns.top_lang_codes()) == ['en', 'de', None, 'en']
+            assert list(columns.mask_above(0.5)) == [True, False, False, True]
+            assert math.isnan(columns.confidence[2])
+            assert {code: list(indices) for code, indices in columns.group_indices_by_lang().items()} == {'en': [0, 3], 'de': [1]}
+
+        assert isinstance(columns.top_lang_codes(), list)
+        assert columns.lang_codes == ['en', 'de']
+
+    def test_profanity_columns(self):
+        columns = LinguinResponse(FakeResponse(200, b'{"scores": [0.1, 0.95, 0.6]}')).columns()
+
+        assert type(columns) is ProfanityColumns
+        assert isinstance(columns.scores, numpy.ndarray)
+        assert list(columns.mask_above(0.5)) == [False, True, True]
+        assert list(columns.indices_above(0.9)) == [1]
+        assert list(ProfanityColumns.from_results([0.1, 0.95], use_numpy=False).indices_above(0.5)) == [1]
+
+    def test_partial_response_columns(self):
+        response = LinguinResponse(result={'scores': [0.1, None, 0.95], 'errors': {1: LinguinInputError(400, 'Invalid query.')}})
+
+        for use_numpy in (True, False):
+            columns = response.columns(use_numpy=use_numpy)
+
+            assert math.isnan(columns.scores[1])
+            assert list(columns.mask_above(0.5)) == [False, False, True]
+            assert list(columns.indices_above(0.05)) == [0, 2]
+
+        columns = LinguinResponse(result={'results': [None, self.results[0]], 'errors': {}}).columns()
+        assert list(columns.top_lang_codes()) == [None, 'en']
@@ -0,0 +1,168 @@
+import json
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinDeadlineExceededError, LinguinInternalError
+from linguin.hedging import HedgePolicy
+from linguin.mock_server import MockLinguinServer
+from linguin.quota import QuotaTracker
+from linguin.retry import RetryBudget, RetryPolicy, TokenBucket
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/profanity'
+
+    def test_deadline_cuts_slow_request(self):
+        server = MockLinguinServer(latency=0.5).start()
+        linguin = Linguin(self.api_token, base_uri=server.base_uri)
+
+        started = time.perf_counter()
+        response = linguin.detect_profanity('test', deadline=0.1)
+
+        assert isinstance(response.error, LinguinDeadlineExceededError)
+        assert time.perf_counter() - started < 0.4
+        linguin.close()
+        server.stop()
+
+    @responses.activate
+    def test_deadline_covers_retries(self):
+        responses.add(responses.POST, self.url, body='down', status=503, headers={'Retry-After': '1'})
+        linguin = Linguin(self.api_token, retry=RetryPolicy(budget=RetryBudget(max_tokens=100)))
+
+        started = time.perf_counter()
+        response = linguin.detect_profanity('test', deadline=0.3)
+
+        assert isinstance(response.error, LinguinInternalError)
+        assert time.perf_counter() - started < 0.3
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_expired_deadline_sends_nothing(self):
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', 'b'], deadline=0)
+
+        assert isinstance(response.error, LinguinDeadlineExceededError)
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_deadline_bounds_rate_limiter_wait(self):
+        responses.add(responses.POST, self.url, json={'score': 0.1})
+        linguin = Linguin(self.api_token, rate_limiter=TokenBucket(rate=1, capacity=1))
+
+        assert linguin.detect_profanity('a', deadline=0.1).is_success == True
+        response = linguin.detect_profanity('b', deadline=0.1)
+
+        assert isinstance(response.error, LinguinDeadlineExceededError)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_deadline_while_micro_batching(self):
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/bulk_detect/profanity', json={'scores': [0.1]})
+        linguin = Linguin(self.api_token, micro_batch_wait=0.5)
+
+        response = linguin.detect_profanity('a', deadline=0.05)
+
+        assert isinstance(response.error, LinguinDeadlineExceededError)
+        linguin.close()
+
+    def test_coalesced_call_keeps_own_deadline(self):
+        server = MockLinguinServer(latency=0.3).start()
+        linguin = Linguin(self.api_token, base_uri=server.base_uri)
+
+        with ThreadPoolExecutor(2) as executor:
+            hurried = executor.submit(linguin.detect_profanity, 'test', deadline=0.1)
+            time.sleep(0.02)
+            patient = executor.submit(linguin.detect_profanity, 'test')
+
+            assert isinstance(hurried.result().error, LinguinDeadlineExceededError)
+            assert patient.result().result == {'score': 0.01}
+
+        linguin.close()
+        server.stop()
+
+class TestHedging(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/profanity'
+        self.calls = 0
+
+    def slow_first(self, request):
+        self.calls += 1
+
+        if self.calls == 1:
+            time.sleep(0.5)
+            return (200, {}, json.dumps({'score': 0.5}))
+
+        return (200, {}, json.dumps({'score': 0.1}))
+
+    @responses.activate
+    def test_hedge_wins_over_slow_request(self):
+        responses.add_callback(responses.POST, self.url, callback=self.slow_first)
+        hedge = HedgePolicy(delay=0.05)
+        linguin = Linguin(self.api_token, hedge=hedge)
+
+        started = time.perf_counter()
+        response = linguin.detect_profanity('test')
+
+        assert response.result == {'score': 0.1}
+        assert time.perf_counter() - started < 0.4
+        assert hedge.hedges == 1
+        assert hedge.hedge_wins == 1
+        linguin.close()
+
+    @responses.activate
+    def test_hedge_counts_against_quota(self):
+        responses.add_callback(responses.POST, self.url, callback=self.slow_first)
+        quota = QuotaTracker()
+        quota.update({'daily_limit': 100, 'detections_today': 0, 'remaining_today': 100})
+        linguin = Linguin(self.api_token, hedge=HedgePolicy(delay=0.05), quota=quota)
+
+        assert linguin.detect_profanity('test').result == {'score': 0.1}
+        assert quota.remaining_today == 98
+        linguin.close()
+
+    @responses.activate
+    def test_bulk_requests_are_not_hedged(self):
+        bulk_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+        responses.add_callback(responses.POST, bulk_url, callback=lambda request: (time.sleep(0.1), (200, {}, '{"scores": [0.1, 0.2]}'))[1])
+        hedge = HedgePolicy(delay=0.01)
+        linguin = Linguin(self.api_token, hedge=hedge)
+
+        assert linguin.bulk_detect_profanity(['a', 'b']).result == {'scores': [0.1, 0.2]}
+        assert hedge.hedges == 0
+        assert len(responses.calls) == 1
+        linguin.close()
+
+    @responses.activate
+    def test_fast_requests_are_not_hedged(self):
+        responses.add(responses.POST, self.url, json={'score': 0.1})
+        hedge = HedgePolicy(delay=0.5)
+        linguin = Linguin(self.api_token, hedge=hedge)
+
+        assert linguin.detect_profanity('test').result == {'score': 0.1}
+        assert hedge.hedges == 0
+        assert len(responses.calls) == 1
+        linguin.close()
+
+    def test_delay_from_observed_percentile(self):
+        hedge = HedgePolicy(percentile=95, min_samples=10)
+
+        for latency in range(9):
+            hedge.record(latency)
+
+        assert hedge.hedge_delay() is None
+
+        for latency in range(9, 100):
+            hedge.record(latency)
+
+        assert hedge.hedge_delay() == 94
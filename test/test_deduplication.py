@@ -0,0 +1,67 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.singleflight import SingleFlight
+
+class TestDeduplication(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.linguin = Linguin(self.api_token)
+        self.url = 'https://api.linguin.ai/v2/detect/profanity'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+
+    @responses.activate
+    def test_bulk_sends_unique_texts(self):
+        responses.add(responses.POST, self.bulk_url, json={'scores': [0.1, 0.9]}, status=200)
+
+        response = self.linguin.bulk_detect_profanity(['ok', 'moron', ' ok', 'ok', 'moron'])
+
+        assert response.result == {'scores': [0.1, 0.9, 0.1, 0.1, 0.9]}
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.body == 'q%5B%5D=ok&q%5B%5D=moron'
+
+    @responses.activate
+    def test_concurrent_detect_coalesced(self):
+        def slow_score(request):
+            time.sleep(0.1)
+            return (200, {}, '{"score": 0.5}')
+
+        responses.add_callback(responses.POST, self.url, callback=slow_score)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: self.linguin.detect_profanity('ok'), range(4)))
+
+        assert all(result.result == {'score': 0.5} for result in results)
+        assert len(responses.calls) == 1
+
+    def test_single_flight_propagates_errors(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait()
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, 'key', failing)
+            started.wait()
+            follower = executor.submit(single_flight.do, 'key', lambda: 'unused')
+            time.sleep(0.05)
+            release.set()
+
+            with self.assertRaises(ValueError):
+                leader.result()
+
+            with self.assertRaises(ValueError):
+                follower.result()
+
+        assert single_flight.do('key', lambda: 'fresh') == 'fresh'
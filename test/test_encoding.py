@@ -0,0 +1,54 @@
+import gzip
+import json
+import unittest
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.encoding import RequestEncoder
+
+class TestEncoding(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/language'
+
+    def test_encode(self):
+        assert RequestEncoder().encode({'q': 'test'}) == ({'q': 'test'}, {})
+
+        body, headers = RequestEncoder('json').encode({'q[]': ['привет', '日本']})
+        assert json.loads(body) == {'q': ['привет', '日本']}
+        assert len(body) < len('q%5B%5D=%D0%BF%D1%80%D0%B8%D0%B2%D0%B5%D1%82&q%5B%5D=%E6%97%A5%E6%9C%AC')
+        assert headers == {'Content-Type': 'application/json'}
+
+        body, headers = RequestEncoder('form', 'deflate', compress_threshold=0).encode({'q': 'test'})
+        assert headers['Content-Encoding'] == 'deflate'
+
+        with self.assertRaises(ValueError):
+            RequestEncoder('xml')
+
+    @responses.activate
+    def test_compressed_json_body(self):
+        responses.add(responses.POST, self.bulk_url, json={'results': [[], []]}, status=200)
+        linguin = Linguin(self.api_token, encoder=RequestEncoder('json', 'gzip', compress_threshold=10))
+
+        linguin.bulk_detect_language(['привет мир', 'こんにちは'])
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Encoding'] == 'gzip'
+        assert request.headers['Content-Type'] == 'application/json'
+        assert request.headers['Authorization'] == 'Bearer {token}'.format(token=self.api_token)
+        assert json.loads(gzip.decompress(request.body)) == {'q': ['привет мир', 'こんにちは']}
+
+    @responses.activate
+    def test_falls_back_to_form(self):
+        responses.add(responses.POST, self.bulk_url, body='unsupported', status=415)
+        responses.add(responses.POST, self.bulk_url, json={'results': [[]]}, status=200)
+        linguin = Linguin(self.api_token, encoder=RequestEncoder('json'))
+
+        response = linguin.bulk_detect_language(['test'])
+
+        assert response.is_success == True
+        assert responses.calls[1].request.body == 'q%5B%5D=test'
+        assert linguin.encoder.is_plain_form
@@ -0,0 +1,108 @@
+import math
+import unittest
+from urllib.parse import parse_qs
+import numpy
+import pandas
+import pyarrow
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinAuthenticationError, LinguinInternalError
+from linguin.frame import detect_language, detect_profanity
+
+class TestFrame(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.language_url = 'https://api.linguin.ai/v2/bulk_detect/language'
+        self.profanity_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+        self.sent = []
+        self.linguin = Linguin(self.api_token, max_batch_size=2, max_workers=2)
+
+    def tearDown(self):
+        self.linguin.close()
+
+    def echo_language(self, request):
+        texts = parse_qs(request.body)['q[]']
+        self.sent.extend(texts)
+        results = ', '.join('[{"lang": "%s", "confidence": 0.5}, {"lang": "xx", "confidence": 0.1}]' % text[:2] for text in texts)
+        return (200, {}, '{"results": [%s]}' % results)
+
+    def score_length(self, request):
+        texts = parse_qs(request.body)['q[]']
+        self.sent.extend(texts)
+        return (200, {}, '{"scores": [%s]}' % ', '.join(str(len(text) / 10) for text in texts))
+
+    @responses.activate
+    def test_detect_language_on_data_frame(self):
+        responses.add_callback(responses.POST, self.language_url, callback=self.echo_language)
+        frame = pandas.DataFrame({'text': ['en one', None, 'de zwei', ' ', 'en one', 'fr trois']}, index=[10, 11, 12, 13, 14, 15])
+
+        result = detect_language(self.linguin, frame, chunk_size=2)
+
+        assert list(result.index) == [10, 11, 12, 13, 14, 15]
+        assert result['lang'].dtype == 'category'
+        assert result['lang'][[10, 12, 14, 15]].tolist() == ['en', 'de', 'en', 'fr']
+        assert result['lang'].isna().tolist() == [False, True, False, True, False, False]
+        assert result['confidence'].dtype == numpy.float64
+        assert result['confidence'][10] == 0.5 and math.isnan(result['confidence'][13])
+        assert sorted(self.sent) == ['de zwei', 'en one', 'fr trois']
+
+    @responses.activate
+    def test_detect_profanity_on_series(self):
+        responses.add_callback(responses.POST, self.profanity_url, callback=self.score_length)
+        series = pandas.Series(['abc', 'abcd', 'abc', ''], index=['a', 'b', 'c', 'd'])
+
+        result = detect_profanity(self.linguin, series)
+
+        assert list(result.columns) == ['profanity_score']
+        assert result['profanity_score'][['a', 'b', 'c']].tolist() == [0.3, 0.4, 0.3]
+        assert math.isnan(result['profanity_score']['d'])
+        assert len(self.sent) == 2
+
+    @responses.activate
+    def test_detect_language_on_arrow_table(self):
+        responses.add_callback(responses.POST, self.language_url, callback=self.echo_language)
+        table = pyarrow.Table.from_batches([
+            pyarrow.record_batch({'text': ['en one', None]}),
+            pyarrow.record_batch({'text': ['de zwei', 'en one']})
+        ])
+
+        result = detect_language(self.linguin, table)
+
+        assert result.column('lang').type == pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        assert result.column('lang').to_pylist() == ['en', None, 'de', 'en']
+        assert result.column('confidence').to_pylist() == [0.5, None, 0.5, 0.5]
+
+    @responses.activate
+    def test_detect_profanity_on_arrow_array(self):
+        responses.add_callback(responses.POST, self.profanity_url, callback=self.score_length)
+
+        result = detect_profanity(self.linguin, pyarrow.array(['ab', None, 'ab']))
+
+        assert result.column('profanity_score').to_pylist() == [0.2, None, 0.2]
+        assert self.sent == ['ab']
+
+    @responses.activate
+    def test_failed_calls_raise(self):
+        responses.add(responses.POST, self.profanity_url, body='Unauthorized', status=401)
+
+        with self.assertRaises(LinguinAuthenticationError):
+            detect_profanity(self.linguin, pandas.Series(['a', 'b']))
+
+    @responses.activate
+    def test_failed_texts_raise(self):
+        def fail_ab(request):
+            if 'ab' in parse_qs(request.body)['q[]']:
+                return (503, {}, 'Service unavailable')
+            return self.score_length(request)
+
+        responses.add_callback(responses.POST, self.profanity_url, callback=fail_ab)
+
+        with self.assertRaises(LinguinInternalError):
+            detect_profanity(self.linguin, pandas.Series(['a', 'ab', 'abc', '']))
+
+        responses.replace(responses.POST, self.profanity_url, body='{"scores": [0.1]}', status=200)
+        assert detect_profanity(self.linguin, pandas.Series(['a', ''])).profanity_score.isna().tolist() == [False, True]
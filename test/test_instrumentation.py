@@ -0,0 +1,128 @@
+import unittest
+from unittest import mock
+import requests
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.cache import MemoryCache
+from linguin.encoding import RequestEncoder
+from linguin.instrumentation import Instrumentation, MetricsAggregator
+from linguin.mock_server import MockLinguinServer
+from linguin.reduction import TextReducer
+from linguin.retry import RetryPolicy
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_request_start(self, event):
+        self.started.append(event)
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/language'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+
+    @responses.activate
+    @mock.patch('time.sleep')
+    def test_request_events(self, sleep):
+        responses.add(responses.POST, self.bulk_url, body='down', status=503)
+        responses.add(responses.POST, self.bulk_url, json={'scores': [0.1, 0.2]}, status=200)
+        recorder = Recorder()
+        linguin = Linguin(self.api_token, instrumentation=recorder, retry=RetryPolicy())
+
+        linguin.bulk_detect_profanity(['a', 'b'])
+
+        event, = recorder.ended
+        assert recorder.started == [event]
+        assert (event.method, event.endpoint, event.texts, event.status, event.retries) == ('POST', 'bulk_detect/profanity', 2, 200, 1)
+        assert event.bytes_sent == len('q%5B%5D=a&q%5B%5D=b')
+        assert event.bytes_received == len('{"scores": [0.1, 0.2]}')
+        assert event.total_seconds > event.decode_seconds > 0
+
+    @responses.activate
+    def test_failed_request_event(self):
+        responses.add(responses.POST, self.url, body=requests.ConnectionError('reset'))
+        recorder = Recorder()
+        linguin = Linguin(self.api_token, instrumentation=recorder)
+
+        with self.assertRaises(requests.ConnectionError):
+            linguin.detect_language('test')
+
+        assert recorder.ended[0].status is None
+        assert type(recorder.ended[0].error) is requests.ConnectionError
+
+    @responses.activate
+    def test_prometheus_export(self):
+        responses.add(responses.POST, self.url, json={'results': []}, status=200)
+        metrics = MetricsAggregator(buckets=(0.1, 1.0))
+        linguin = Linguin(self.api_token, instrumentation=metrics, cache=MemoryCache())
+
+        linguin.detect_language('test')
+        linguin.detect_language('test')
+        exported = metrics.to_prometheus()
+
+        assert '# TYPE linguin_requests_total counter' in exported
+        assert 'linguin_requests_total{endpoint="detect/language",status="200"} 1' in exported
+        assert 'linguin_cache_hits_total{kind="language"} 1' in exported
+        assert 'linguin_cache_misses_total{kind="language"} 1' in exported
+        assert 'linguin_request_duration_seconds_bucket{endpoint="detect/language",le="+Inf"} 1' in exported
+        assert 'linguin_request_duration_seconds_count{endpoint="detect/language"} 1' in exported
+        assert 'linguin_request_decode_seconds_count{endpoint="detect/language"} 1' in exported
+
+    @responses.activate
+    def test_micro_batched_texts_are_looked_up_once(self):
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/bulk_detect/language', json={'results': [[]]}, status=200)
+        metrics = MetricsAggregator()
+        linguin = Linguin(self.api_token, instrumentation=metrics, cache=MemoryCache(), micro_batch_wait=0.01)
+
+        linguin.detect_language('test')
+        exported = metrics.to_prometheus()
+        linguin.close()
+
+        assert 'linguin_cache_misses_total{kind="language"} 1' in exported
+        assert 'linguin_micro_batches_total{kind="language"} 1' in exported
+
+    @responses.activate
+    def test_streamed_texts_are_prepared_once(self):
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/bulk_detect/language', json={'results': [[], []]}, status=200)
+        metrics = MetricsAggregator()
+        reducer = mock.Mock(wraps=TextReducer())
+        linguin = Linguin(self.api_token, instrumentation=metrics, cache=MemoryCache(), reducer=reducer)
+
+        assert len(list(linguin.iter_detect_language(['a', 'b']))) == 2
+        linguin.close()
+
+        assert reducer.reduce.call_count == 2
+        assert 'linguin_cache_misses_total{kind="language"} 2' in metrics.to_prometheus()
+
+    def test_urllib_transport_metrics(self):
+        server = MockLinguinServer().start()
+        recorder = Recorder()
+        metrics = MetricsAggregator()
+
+        for encoder, body in ((RequestEncoder(), b'q%5B%5D=a&q%5B%5D=b'), (RequestEncoder(format='json'), b'{"q": ["a", "b"]}')):
+            linguin = Linguin(self.api_token, base_uri=server.base_uri, transport='urllib', instrumentation=recorder, encoder=encoder)
+            assert linguin.bulk_detect_profanity(['a', 'b']).is_success == True
+            linguin.close()
+
+            event = recorder.ended[-1]
+            assert event.bytes_sent == len(body)
+            assert event.bytes_received == len('{"scores": [0.01, 0.01]}')
+            assert event.server_seconds > 0
+
+        linguin = Linguin(self.api_token, base_uri=server.base_uri, transport='urllib', instrumentation=metrics)
+        linguin.bulk_detect_profanity(['a', 'b'])
+        linguin.close()
+        server.stop()
+
+        assert 'linguin_requests_total{endpoint="bulk_detect/profanity",status="200"} 1' in metrics.to_prometheus()
+        assert 'linguin_bytes_sent_total{endpoint="bulk_detect/profanity"} %d' % len('q%5B%5D=a&q%5B%5D=b') in metrics.to_prometheus()
@@ -0,0 +1,76 @@
+import threading
+import unittest
+from urllib.parse import parse_qs
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInputError, LinguinRateLimitError
+from linguin.encoding import RequestEncoder
+
+def echo_profanity(request):
+    texts = parse_qs(request.body)['q[]']
+    return (200, {}, '{"scores": [%s]}' % ', '.join(texts))
+
+class TestIterDetect(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+        self.linguin = Linguin(self.api_token, max_batch_size=3, max_workers=2)
+
+    @responses.activate
+    def test_iter_in_order(self):
+        responses.add_callback(responses.POST, self.url, callback=echo_profanity)
+
+        results = list(self.linguin.iter_detect_profanity(str(index) for index in range(10)))
+
+        assert results == [(index, float(index)) for index in range(10)]
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_iter_is_lazy(self):
+        responses.add_callback(responses.POST, self.url, callback=echo_profanity)
+        consumed = []
+
+        def texts():
+            for index in range(1000):
+                consumed.append(index)
+                yield str(index)
+
+        iterator = self.linguin.iter_detect_profanity(texts())
+        assert next(iterator) == (0, 0.0)
+        assert len(consumed) <= 3 * 2 + 1
+
+        iterator.close()
+        self.linguin.close()
+
+    @responses.activate
+    def test_iter_errors(self):
+        responses.add(responses.POST, self.url, body='slow down', status=429)
+
+        with self.assertRaises(LinguinRateLimitError):
+            list(self.linguin.iter_detect_profanity(['a', 'b']))
+
+        with self.assertRaises(LinguinInputError):
+            list(self.linguin.iter_detect_profanity(['a', ' ']))
+
+    @responses.activate
+    def test_iter_after_encoder_fallback(self):
+        def form_only(request):
+            if request.headers['Content-Type'] == 'application/json':
+                return (415, {}, 'unsupported')
+            return (200, {}, '{"scores": [%s]}' % ', '.join('0.1' for _ in parse_qs(request.body)['q[]']))
+
+        responses.add_callback(responses.POST, self.url, callback=form_only)
+        linguin = Linguin(self.api_token, encoder=RequestEncoder('json'), max_batch_bytes=200, max_workers=1)
+        texts = ['こんにちは世界' * index for index in range(1, 13)]
+        results = []
+        worker = threading.Thread(target=lambda: results.extend(linguin.iter_detect_profanity(texts)), daemon=True)
+
+        worker.start()
+        worker.join(5)
+
+        assert results == [(index, 0.1) for index in range(12)]
+        linguin.close()
@@ -1,10 +1,16 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 import responses
 from linguin import Linguin
+from linguin import LinguinInternalError
+from linguin.languages import LanguageCache
 
 class TestLanguages(unittest.TestCase):
     def setUp(self):
         self.url = 'https://api.linguin.ai/v2/languages'
+        Linguin.language_cache.clear()
 
     @responses.activate
     def test_languages(self):
@@ -15,3 +21,62 @@ class TestLanguages(unittest.TestCase):
         assert languages == successful_response
         assert len(responses.calls) == 1
         assert responses.calls[0].request.url == self.url
+
+    @responses.activate
+    def test_languages_cached_and_revalidated(self):
+        successful_response = {'de': ['German', 'Deutsch'], 'en': ['English', 'English']}
+        responses.add(responses.GET, self.url, json=successful_response, status=200, headers={'ETag': '"v1"'})
+
+        table = Linguin.language_table()
+        assert Linguin.languages() == successful_response
+        assert len(responses.calls) == 1
+        assert table.id('en') == 1 and table.code(0) == 'de'
+        assert table.name('de') == 'German' and table.native_name('de') == 'Deutsch'
+        assert 'fr' not in table
+
+        responses.replace(responses.GET, self.url, status=304)
+        assert Linguin.language_table(refresh=True) is table
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+
+    @responses.activate
+    def test_languages_persisted(self):
+        successful_response = {'de': ['German', 'Deutsch']}
+        responses.add(responses.GET, self.url, json=successful_response, status=200)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'languages.json')
+
+            with mock.patch.object(Linguin, 'language_cache', LanguageCache(path=path)):
+                Linguin.languages()
+
+            with mock.patch.object(Linguin, 'language_cache', LanguageCache(path=path)):
+                assert Linguin.languages() == successful_response
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_languages_error(self):
+        responses.add(responses.GET, self.url, body='down', status=503)
+
+        with self.assertRaises(LinguinInternalError):
+            Linguin.languages()
+
+    @responses.activate
+    def test_languages_stale_after_failed_revalidation(self):
+        successful_response = {'de': ['German', 'Deutsch']}
+        responses.add(responses.GET, self.url, json=successful_response, status=200)
+        cache = LanguageCache(max_age=0, retry_interval=60)
+
+        with mock.patch.object(Linguin, 'language_cache', cache):
+            Linguin.languages()
+            responses.replace(responses.GET, self.url, body='down', status=503)
+
+            for _ in range(5):
+                assert Linguin.languages() == successful_response
+
+            assert len(responses.calls) == 2
+
+            with mock.patch('time.time', return_value=cache._retry_at):
+                Linguin.languages()
+
+            assert len(responses.calls) == 3
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+from linguin import LinguinResponse
+from linguin import LinguinRateLimitError, LinguinUnknownError
+
+class FakeResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+class TestLinguinResponse(unittest.TestCase):
+    def test_lazy_result(self):
+        body = b'{"results": [{"lang": "de", "confidence": 0.2}, {"lang": "en", "confidence": 0.9}]}'
+
+        with mock.patch('linguin.linguin_response.json_loads') as json_loads:
+            response = LinguinResponse(FakeResponse(200, body))
+            json_loads.assert_not_called()
+
+        response = LinguinResponse(FakeResponse(200, body))
+        assert response.is_success == True
+        assert response.top_language == 'en'
+        assert response.top_confidence == 0.9
+        assert response.result is response.result
+        assert not hasattr(response, '__dict__')
+
+    def test_bulk_accessors(self):
+        body = b'{"results": [[{"lang": "en", "confidence": 1.0}], []]}'
+        response = LinguinResponse(FakeResponse(200, body))
+
+        assert response.top_languages == ['en', None]
+        assert response.top_confidences == [1.0, None]
+
+    def test_errors(self):
+        response = LinguinResponse(FakeResponse(429, 'zu viele Anfragen – später'.encode('utf-8')))
+
+        assert type(response.error) is LinguinRateLimitError
+        assert response.error.message == 'zu viele Anfragen – später'
+        assert response.result == None
+        assert response.top_language == None
+        assert type(LinguinResponse(FakeResponse(418, b'teapot')).error) is LinguinUnknownError
@@ -0,0 +1,56 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInternalError
+from linguin.batcher import MicroBatcher
+
+def echo_language(request):
+    texts = parse_qs(request.body)['q[]']
+    return (200, {}, '{"results": [%s]}' % ', '.join('[{"lang": "%s", "confidence": 1.0}]' % text for text in texts))
+
+class TestMicroBatching(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/language'
+
+    def test_batcher_flushes_by_size(self):
+        batches = []
+
+        def flush(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(flush, max_size=3, max_wait=10)
+        futures = [batcher.submit(item) for item in range(6)]
+
+        assert [future.result(timeout=1) for future in futures] == [0, 2, 4, 6, 8, 10]
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+        batcher.close()
+
+    @responses.activate
+    def test_single_calls_become_bulk(self):
+        responses.add_callback(responses.POST, self.bulk_url, callback=echo_language)
+        texts = ['t{}'.format(index) for index in range(8)]
+
+        with Linguin(self.api_token, micro_batch_wait=0.05) as linguin:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(linguin.detect_language, texts))
+
+        assert [result.result['results'][0]['lang'] for result in results] == texts
+        assert len(responses.calls) < len(texts)
+
+    @responses.activate
+    def test_batch_error_reaches_every_caller(self):
+        responses.add(responses.POST, self.bulk_url, body='down', status=500)
+
+        with Linguin(self.api_token, micro_batch_wait=0.001) as linguin:
+            response = linguin.detect_language('test')
+
+        assert response.is_success == False
+        assert type(response.error) is LinguinInternalError
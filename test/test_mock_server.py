@@ -0,0 +1,77 @@
+import time
+import unittest
+from unittest import mock
+import requests
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInputError, LinguinRateLimitError
+from linguin.benchmark import run
+from linguin.mock_server import MockLinguinServer
+from linguin.retry import RetryBudget, RetryPolicy
+
+class TestMockServer(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.server = MockLinguinServer(max_bulk_size=3, daily_limit=100, seed=1).start()
+        self.linguin = Linguin(self.api_token, base_uri=self.server.base_uri)
+
+    def tearDown(self):
+        self.linguin.close()
+        self.server.stop()
+
+    def test_endpoints_over_one_connection(self):
+        assert self.linguin.detect_language('고마워요').top_language == 'ko'
+        assert self.linguin.detect_profanity('you moron').result == {'score': 0.99}
+        assert self.linguin.bulk_detect_profanity(['a test', 'idiot']).result == {'scores': [0.01, 0.99]}
+        assert self.linguin.bulk_detect_language(['สวัสดี', 'test']).top_languages == ['th', 'en']
+        assert self.linguin.status().result == {'daily_limit': 100, 'detections_today': 6, 'remaining_today': 94}
+        assert 'en' in requests.get(self.server.base_uri + '/v2/languages').json()
+        assert self.server.connections == 2
+
+    def test_limits_and_error_injection(self):
+        assert type(self.linguin.bulk_detect_language(['a', 'b', 'c', 'd']).error) is LinguinInputError
+
+        self.server.rate_limit_rate = 1.0
+        assert type(self.linguin.detect_language('test').error) is LinguinRateLimitError
+
+        self.server.rate_limit_rate = 0.5
+        linguin = Linguin(self.api_token, base_uri=self.server.base_uri, retry=RetryPolicy(max_retries=10, budget=RetryBudget(max_tokens=100)))
+
+        with mock.patch('time.sleep'):
+            responses = [linguin.detect_language('test {}'.format(index)) for index in range(10)]
+
+        assert all(response.is_success for response in responses)
+        linguin.close()
+
+    def test_benchmark(self):
+        texts = ['text {}'.format(index) for index in range(6)]
+
+        for mode in ('single', 'bulk', 'concurrent'):
+            result = run(mode, texts, self.server.base_uri, concurrency=2, batch_size=3)
+
+            assert result['texts'] == 6
+            assert result['requests'] == (2 if mode == 'bulk' else 6)
+            assert 0 < result['p50'] <= result['p99']
+
+    @mock.patch('linguin.mock_server.MockLinguinServer')
+    def test_main_options(self, server):
+        from linguin.mock_server import main
+
+        with mock.patch('builtins.print'):
+            main(['--port', '0', '--max-body-bytes', '2048', '--daily-limit', '5'])
+
+        assert server.call_args[0][7:] == (2048, 5)
+        server.return_value.serve_forever.assert_called_once_with()
+
+    def test_client_giving_up_is_not_an_error(self):
+        self.server.latency = 0.2
+
+        with mock.patch('sys.stderr') as stderr:
+            response = self.linguin.detect_language('test', deadline=0.05)
+            time.sleep(0.3)
+
+        assert response.is_success == False
+        assert not stderr.write.called
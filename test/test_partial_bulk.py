@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs
+import requests
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInputError, LinguinInternalError, LinguinAuthenticationError, LinguinRateLimitError
+from linguin.cache import MemoryCache
+from linguin.retry import RetryPolicy
+
+class TestPartialBulk(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+        self.sent = []
+
+    def score(self, poison=None, status=500):
+        def callback(request):
+            texts = parse_qs(request.body)['q[]']
+            self.sent.append(texts)
+
+            if poison in texts:
+                return (status, {}, 'Internal Server Error')
+            return (200, {}, '{"scores": [%s]}' % ', '.join(str(len(text) / 10) for text in texts))
+
+        return callback
+
+    @responses.activate
+    def test_skips_empty_texts(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score())
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', ' ', 'bb', ''], partial=True)
+
+        assert response.is_success == True
+        assert response.result['scores'] == [0.1, None, 0.2, None]
+        assert sorted(response.result['errors']) == [1, 3]
+        assert isinstance(response.result['errors'][1], LinguinInputError)
+        assert self.sent == [['a', 'bb']]
+
+    @responses.activate
+    def test_without_partial_empty_text_fails(self):
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', ''])
+
+        assert isinstance(response.error, LinguinInputError)
+
+    @responses.activate
+    def test_bisects_server_errors(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score(poison='ccc'))
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', 'bb', 'ccc', 'dddd'], partial=True)
+
+        assert response.result['scores'] == [0.1, 0.2, None, 0.4]
+        assert list(response.result['errors']) == [2]
+        assert isinstance(response.result['errors'][2], LinguinInternalError)
+        assert self.sent == [['a', 'bb', 'ccc', 'dddd'], ['a', 'bb'], ['ccc', 'dddd'], ['ccc'], ['dddd']]
+
+    @responses.activate
+    def test_bisects_failed_chunks_only(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score(poison='ccc'))
+        linguin = Linguin(self.api_token, max_batch_size=2, max_workers=1)
+
+        response = linguin.bulk_detect_profanity(['a', 'bb', 'ccc', 'dddd', 'a'], partial=True)
+
+        assert response.result['scores'] == [0.1, 0.2, None, 0.4, 0.1]
+        assert list(response.result['errors']) == [2]
+        assert self.sent == [['a', 'bb'], ['ccc', 'dddd'], ['ccc'], ['dddd']]
+
+    @responses.activate
+    def test_does_not_bisect_other_errors(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score(poison='ccc', status=401))
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', 'ccc'], partial=True)
+
+        assert response.result['scores'] == [None, None]
+        assert isinstance(response.result['errors'][0], LinguinAuthenticationError)
+        assert len(self.sent) == 1
+
+    @responses.activate
+    def test_does_not_bisect_rate_limits(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score(poison='ccc', status=429))
+        linguin = Linguin(self.api_token)
+
+        response = linguin.bulk_detect_profanity(['a', 'bb', 'ccc', 'dddd'], partial=True)
+
+        assert response.result['scores'] == [None] * 4
+        assert sorted(response.result['errors']) == [0, 1, 2, 3]
+        assert isinstance(response.result['errors'][0], LinguinRateLimitError)
+        assert len(self.sent) == 1
+
+    @responses.activate
+    @mock.patch('time.sleep')
+    def test_resends_rate_limited_chunks(self, sleep):
+        responses.add(responses.POST, self.url, body='Too Many Requests', status=429, headers={'Retry-After': '2'})
+        responses.add_callback(responses.POST, self.url, callback=self.score())
+        linguin = Linguin(self.api_token, retry=RetryPolicy(backoff=0.1))
+
+        response = linguin.bulk_detect_profanity(['a', 'bb', 'ccc'], partial=True)
+
+        assert response.result == {'scores': [0.1, 0.2, 0.3], 'errors': {}}
+        assert self.sent == [['a', 'bb', 'ccc']]
+        assert 2 <= sleep.call_args_list[0][0][0] <= 2.1
+
+    @responses.activate
+    def test_connection_errors_fail_their_chunk_only(self):
+        def callback(request):
+            if 'ccc' in parse_qs(request.body)['q[]']:
+                raise requests.ConnectionError('reset')
+            return self.score()(request)
+
+        responses.add_callback(responses.POST, self.url, callback=callback)
+        linguin = Linguin(self.api_token, max_batch_size=2)
+
+        response = linguin.bulk_detect_profanity(['a', 'bb', 'ccc', 'dddd', 'e', 'ff'], partial=True)
+
+        assert response.result['scores'] == [0.1, 0.2, None, None, 0.1, 0.2]
+        assert sorted(response.result['errors']) == [2, 3]
+        assert isinstance(response.result['errors'][2], requests.ConnectionError)
+
+    @responses.activate
+    def test_caches_successful_texts_only(self):
+        responses.add_callback(responses.POST, self.url, callback=self.score(poison='ccc'))
+        linguin = Linguin(self.api_token, cache=MemoryCache())
+
+        linguin.bulk_detect_profanity(['a', 'ccc'], partial=True)
+        response = linguin.bulk_detect_profanity(['a', 'ccc'], partial=True)
+
+        assert response.result['scores'] == [0.1, None]
+        assert self.sent[-1] == ['ccc']
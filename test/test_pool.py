@@ -0,0 +1,167 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import LinguinPool
+from linguin import LinguinAuthenticationError, LinguinQuotaExceededError, LinguinRateLimitError
+
+class TestPool(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.keys = [self.faker.uuid4(), self.faker.uuid4()]
+        self.status_url = 'https://api.linguin.ai/v2/status'
+        self.url = 'https://api.linguin.ai/v2/detect/profanity'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+
+    def key_of(self, request):
+        return request.headers['Authorization'][len('Bearer '):]
+
+    def status_callback(self, remaining):
+        def callback(request):
+            left = remaining[self.key_of(request)]
+            return (200, {}, json.dumps({'daily_limit': 100, 'detections_today': 100 - left, 'remaining_today': left}))
+
+        return callback
+
+    def detect_keys(self):
+        return [self.key_of(call.request) for call in responses.calls if call.request.url != self.status_url]
+
+    @responses.activate
+    def test_prefers_key_with_most_remaining_quota(self):
+        remaining = {self.keys[0]: 5, self.keys[1]: 50}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        responses.add(responses.POST, self.url, json={'score': 0.1})
+        linguin = LinguinPool(self.keys)
+
+        response = linguin.detect_profanity(self.faker.word())
+
+        assert response.is_success == True
+        assert self.detect_keys() == [self.keys[1]]
+        assert linguin.keys[1].quota.remaining_today == 49
+
+    @responses.activate
+    def test_skips_keys_without_quota(self):
+        remaining = {self.keys[0]: 3, self.keys[1]: 1}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        responses.add(responses.POST, self.bulk_url, json={'scores': [0.1, 0.2]})
+        linguin = LinguinPool(self.keys)
+
+        linguin.bulk_detect_profanity(['a', 'b'])
+        response = linguin.bulk_detect_profanity(['c', 'd'])
+
+        assert self.detect_keys() == [self.keys[0]]
+        assert isinstance(response.error, LinguinQuotaExceededError)
+
+    @responses.activate
+    def test_fails_over_on_rate_limit(self):
+        remaining = {self.keys[0]: 50, self.keys[1]: 10}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+
+        def detect(request):
+            if self.key_of(request) == self.keys[0]:
+                return (429, {}, 'Too Many Requests')
+            return (200, {}, json.dumps({'score': 0.1}))
+
+        responses.add_callback(responses.POST, self.url, callback=detect)
+        linguin = LinguinPool(self.keys)
+
+        response = linguin.detect_profanity(self.faker.word())
+
+        assert response.is_success == True
+        assert self.detect_keys() == [self.keys[0], self.keys[1]]
+        assert linguin.keys[0].quota.remaining_today == 50
+        assert linguin.keys[0].recent_rate_limits(60) == 1
+
+    @responses.activate
+    def test_all_keys_rate_limited(self):
+        remaining = {self.keys[0]: 50, self.keys[1]: 10}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        responses.add(responses.POST, self.url, body='Too Many Requests', status=429, headers={'Retry-After': '2'})
+        linguin = LinguinPool(self.keys)
+
+        response = linguin.detect_profanity(self.faker.word())
+
+        assert type(response.error) is LinguinRateLimitError
+        assert response.error.message == 'Too Many Requests'
+        assert self.detect_keys() == [self.keys[0], self.keys[1]]
+
+    @responses.activate
+    def test_concurrent_rate_limits(self):
+        remaining = {self.keys[0]: 1000, self.keys[1]: 1000}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        responses.add(responses.POST, self.url, body='Too Many Requests', status=429)
+        linguin = LinguinPool(self.keys, rate_limit_window=0)
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(linguin.detect_profanity, ['text'] * 200))
+
+        assert all(type(response.error) is LinguinRateLimitError for response in results)
+
+    @responses.activate
+    def test_connection_error_releases_quota(self):
+        remaining = {self.keys[0]: 50, self.keys[1]: 10}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        responses.add(responses.POST, self.url, body=requests.ConnectionError('reset'))
+        linguin = LinguinPool(self.keys)
+
+        with self.assertRaises(requests.ConnectionError):
+            linguin.detect_profanity(self.faker.word())
+
+        assert linguin.keys[0].quota.remaining_today == 50
+
+    @responses.activate
+    def test_disables_rejected_keys(self):
+        remaining = {self.keys[0]: 50, self.keys[1]: 10}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+
+        def detect(request):
+            if self.key_of(request) == self.keys[0]:
+                return (401, {}, 'Unauthorized')
+            return (200, {}, json.dumps({'score': 0.1}))
+
+        responses.add_callback(responses.POST, self.url, callback=detect)
+        linguin = LinguinPool(self.keys)
+
+        assert linguin.detect_profanity(self.faker.word()).is_success == True
+        assert linguin.detect_profanity(self.faker.word()).is_success == True
+        assert self.detect_keys() == [self.keys[0], self.keys[1], self.keys[1]]
+        assert linguin.keys[0].disabled == True
+
+    @responses.activate
+    def test_all_keys_rejected(self):
+        responses.add(responses.GET, self.status_url, status=401, body='Unauthorized')
+        linguin = LinguinPool(self.keys)
+
+        response = linguin.detect_profanity(self.faker.word())
+
+        assert isinstance(response.error, LinguinAuthenticationError)
+        assert all(state.disabled for state in linguin.keys)
+
+    @responses.activate
+    def test_status_sums_keys(self):
+        remaining = {self.keys[0]: 30, self.keys[1]: 20}
+        responses.add_callback(responses.GET, self.status_url, callback=self.status_callback(remaining))
+        linguin = LinguinPool(self.keys)
+
+        response = linguin.status()
+
+        assert response.result == {'daily_limit': 200, 'detections_today': 150, 'remaining_today': 50}
+
+    def test_overdrawn_key_ranks_last(self):
+        remaining = {self.keys[0]: 1, self.keys[1]: 5}
+        linguin = LinguinPool(self.keys)
+
+        for state in linguin.keys:
+            state.quota.update({'daily_limit': 10, 'detections_today': 0, 'remaining_today': remaining[state.api_key]})
+
+        linguin.keys[0].quota.reserve(2)
+
+        assert linguin._select_key(1, set()) is linguin.keys[1]
+
+    def test_requires_keys(self):
+        with self.assertRaises(ValueError):
+            LinguinPool([])
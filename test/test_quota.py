@@ -0,0 +1,80 @@
+import unittest
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinQuotaExceededError, LinguinRateLimitError
+from linguin.cache import MemoryCache
+from linguin.quota import QuotaTracker
+
+class TestQuota(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.status_url = 'https://api.linguin.ai/v2/status'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/profanity'
+        self.url = 'https://api.linguin.ai/v2/detect/profanity'
+
+    @responses.activate
+    def test_counts_sent_texts(self):
+        responses.add(responses.GET, self.status_url, json={'daily_limit': 100, 'detections_today': 90, 'remaining_today': 10})
+        responses.add(responses.POST, self.bulk_url, json={'scores': [0.1, 0.2]})
+        linguin = Linguin(self.api_token, quota=QuotaTracker(), cache=MemoryCache())
+
+        linguin.bulk_detect_profanity(['a', 'b', 'a'])
+        linguin.bulk_detect_profanity(['b', 'a'])
+
+        assert linguin.quota.remaining_today == 8
+        assert linguin.quota.detections_today == 92
+        assert [call.request.url for call in responses.calls] == [self.status_url, self.bulk_url]
+
+    @responses.activate
+    def test_enforce_fails_fast(self):
+        responses.add(responses.GET, self.status_url, json={'daily_limit': 100, 'detections_today': 99, 'remaining_today': 1})
+        responses.add(responses.POST, self.url, json={'score': 0.1})
+        linguin = Linguin(self.api_token, quota=QuotaTracker(enforce=True))
+
+        assert linguin.status().is_success == True
+        response = linguin.bulk_detect_profanity(['a', 'b'])
+
+        assert type(response.error) is LinguinQuotaExceededError
+        assert isinstance(response.error, LinguinRateLimitError)
+        assert linguin.detect_profanity('a').is_success == True
+        assert type(linguin.detect_profanity('b').error) is LinguinQuotaExceededError
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_failed_requests_are_released(self):
+        responses.add(responses.GET, self.status_url, json={'daily_limit': -1, 'detections_today': None, 'remaining_today': -1})
+        responses.add(responses.POST, self.url, body='down', status=503)
+        linguin = Linguin(self.api_token, quota=QuotaTracker(enforce=True))
+
+        linguin.detect_profanity('a')
+
+        assert linguin.quota.remaining_today == -1
+        assert linguin.quota.detections_today == 0
+
+    def test_overdrawn_quota_is_not_unlimited(self):
+        quota = QuotaTracker()
+        quota.update({'daily_limit': 100, 'detections_today': 0, 'remaining_today': 100})
+
+        quota.reserve(150)
+
+        assert quota.remaining_today == 0
+        assert quota.unlimited == False
+        assert quota.can_send(10 ** 9) == False
+
+        quota.release(100)
+
+        assert quota.remaining_today == 50
+
+    def test_unlimited_quota(self):
+        quota = QuotaTracker()
+        quota.update({'daily_limit': -1, 'detections_today': 10, 'remaining_today': -1})
+
+        quota.reserve(10 ** 6)
+
+        assert quota.unlimited == True
+        assert quota.remaining_today == -1
+        assert quota.can_send(10 ** 9) == True
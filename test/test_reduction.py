@@ -0,0 +1,46 @@
+import unittest
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.reduction import TextReducer
+
+class TestTextReducer(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.text = 'a' * 100 + 'b' * 100 + 'c' * 100
+
+    def test_samples(self):
+        assert TextReducer(max_chars=10, sample='head').reduce(self.text) == 'a' * 10
+        assert TextReducer(max_chars=10, sample='tail').reduce(self.text) == 'c' * 10
+        assert TextReducer(max_chars=10, sample='middle').reduce(self.text) == 'b' * 10
+        assert TextReducer(max_chars=11, sample='spread').reduce(self.text) == 'aaa bbb ccc'
+
+        assert TextReducer(max_chars=5, sample='spread').reduce('abcdef') == 'a c f'
+
+        for options in ({'sample': 'random'}, {'max_chars': 0}, {'max_chars': 4, 'sample': 'spread'}):
+            with self.assertRaises(ValueError):
+                TextReducer(**options)
+
+    def test_whitespace_normalization_and_bytes_saved(self):
+        reducer = TextReducer(max_chars=100)
+
+        assert reducer.reduce('Café  \n\t au   lait') == 'Café au lait'
+        assert reducer.bytes_saved == 7
+        assert reducer.reduce('short') == 'short'
+        assert reducer.bytes_saved == 7
+
+    @responses.activate
+    def test_applied_to_language_only(self):
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/bulk_detect/language', json={'results': [[]]}, status=200)
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/detect/profanity', json={'score': 0.0}, status=200)
+        linguin = Linguin(self.api_token, reducer=TextReducer(max_chars=5))
+
+        linguin.bulk_detect_language([self.text])
+        linguin.detect_profanity(self.text)
+
+        assert responses.calls[0].request.body == 'q%5B%5D=aaaaa'
+        assert responses.calls[1].request.body == 'q={text}'.format(text=self.text)
+        assert linguin.reducer.bytes_saved == 295
@@ -0,0 +1,99 @@
+import time
+import unittest
+from unittest import mock
+import requests
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInternalError
+from linguin.retry import RetryBudget, RetryPolicy, TokenBucket, parse_retry_after
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/language'
+
+    @responses.activate
+    @mock.patch('time.sleep')
+    def test_retries_until_success(self, sleep):
+        successful_response = {'results': [{'lang': 'en', 'confidence': 1.0}]}
+        responses.add(responses.POST, self.url, body='slow down', status=429, headers={'Retry-After': '2'})
+        responses.add(responses.POST, self.url, body='down', status=503)
+        responses.add(responses.POST, self.url, json=successful_response, status=200)
+        linguin = Linguin(self.api_token, retry=RetryPolicy(backoff=0.1))
+
+        response = linguin.detect_language('test')
+
+        assert response.result == successful_response
+        assert len(responses.calls) == 3
+        assert 2 <= sleep.call_args_list[0][0][0] <= 2.1
+        assert 0 <= sleep.call_args_list[1][0][0] <= 0.2
+
+    @responses.activate
+    @mock.patch('time.sleep')
+    def test_gives_up(self, sleep):
+        responses.add(responses.POST, self.url, body='down', status=500)
+        linguin = Linguin(self.api_token, retry=RetryPolicy(max_retries=2))
+
+        response = linguin.detect_language('test')
+
+        assert type(response.error) is LinguinInternalError
+        assert len(responses.calls) == 3
+
+        responses.replace(responses.POST, self.url, body='bad', status=400)
+        linguin.detect_language('other')
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    @mock.patch('time.sleep')
+    def test_retries_connection_errors(self, sleep):
+        responses.add(responses.POST, self.url, body=requests.ConnectionError('reset'))
+        linguin = Linguin(self.api_token, retry=RetryPolicy(max_retries=1))
+
+        with self.assertRaises(requests.ConnectionError):
+            linguin.detect_language('test')
+
+        assert len(responses.calls) == 2
+
+    def test_budget_and_retry_after(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+        assert budget.withdraw() == True
+        assert budget.withdraw() == False
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw() == True
+
+        assert parse_retry_after('3') == 3.0
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+        assert parse_retry_after('soon') is None
+
+    def test_budget_can_be_switched_off(self):
+        assert type(RetryPolicy().budget) is RetryBudget
+        policy = RetryPolicy(max_retries=100, budget=None)
+
+        assert policy.budget is None
+        assert all(policy.should_retry(attempt, 503) for attempt in range(50))
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=100, capacity=2)
+        started = time.monotonic()
+
+        for _ in range(4):
+            bucket.acquire()
+
+        assert time.monotonic() - started >= 0.015
+
+    @mock.patch('time.sleep')
+    def test_token_bucket_below_one_per_second(self, sleep):
+        bucket = TokenBucket(rate=0.5)
+
+        assert bucket.capacity == 1
+        assert bucket.acquire() == True
+        assert bucket.acquire(timeout=1) == False
+
+        with self.assertRaises(ValueError):
+            bucket.acquire(tokens=2)
@@ -0,0 +1,49 @@
+import unittest
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin.script import ScriptClassifier
+
+class TestScriptClassifier(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.classifier = ScriptClassifier()
+        self.linguin = Linguin(self.api_token, preclassifier=self.classifier)
+        self.url = 'https://api.linguin.ai/v2/detect/language'
+        self.bulk_url = 'https://api.linguin.ai/v2/bulk_detect/language'
+
+    def test_classify(self):
+        assert self.classifier.classify('고마워요') == [{'lang': 'ko', 'confidence': 1.0}]
+        assert self.classifier.classify('日本語のテキスト') == [{'lang': 'ja', 'confidence': 1.0}]
+        assert self.classifier.classify('สวัสดีครับ') == [{'lang': 'th', 'confidence': 1.0}]
+        assert self.classifier.classify('Καλημέρα!') == [{'lang': 'el', 'confidence': 1.0}]
+        assert self.classifier.classify('12:30 🎉 https://linguin.ai') == []
+        assert self.classifier.classify('中文') is None
+        assert self.classifier.classify('Bahnhof') is None
+        assert self.classifier.classify('привет') is None
+        assert self.classifier.classify('한국 ひらがな') is None
+
+    @responses.activate
+    def test_detect_local(self):
+        response = self.linguin.detect_language('안녕하세요')
+
+        assert response.result == {'results': [{'lang': 'ko', 'confidence': 1.0}]}
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_bulk_merges_local_and_remote(self):
+        responses.add(responses.POST, self.bulk_url, json={'results': [[{'lang': 'de', 'confidence': 0.9}]]}, status=200)
+
+        response = self.linguin.bulk_detect_language(['สวัสดี', 'Bahnhof', '42'])
+
+        assert response.result == {'results': [[{'lang': 'th', 'confidence': 1.0}], [{'lang': 'de', 'confidence': 0.9}], []]}
+        assert responses.calls[0].request.body == 'q%5B%5D=Bahnhof'
+
+    @responses.activate
+    def test_profanity_not_preclassified(self):
+        responses.add(responses.POST, 'https://api.linguin.ai/v2/detect/profanity', json={'score': 0.1}, status=200)
+
+        assert self.linguin.detect_profanity('안녕하세요').result == {'score': 0.1}
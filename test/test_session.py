@@ -0,0 +1,46 @@
+import unittest
+from unittest import mock
+import responses
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinInputError, LinguinRateLimitError
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.url = 'https://api.linguin.ai/v2/detect/language'
+
+    @responses.activate
+    def test_session_reused_with_timeout(self):
+        responses.add(responses.POST, self.url, json={'results': []}, status=200)
+        linguin = Linguin(self.api_token, pool_size=4, timeout=(1, 2))
+
+        linguin.detect_language('test')
+        linguin.detect_language('test')
+
+        assert len(responses.calls) == 2
+        assert all(call.request.req_kwargs['timeout'] == (1, 2) for call in responses.calls)
+        assert linguin.session.get_adapter(self.url)._pool_maxsize == 4
+
+    def test_context_manager_closes_session(self):
+        linguin = Linguin(self.api_token)
+
+        with mock.patch.object(linguin.session, 'close') as close:
+            with linguin:
+                pass
+
+        close.assert_called_once_with()
+
+    @responses.activate
+    def test_raise_on_error(self):
+        responses.add(responses.POST, self.url, body='slow down', status=429)
+        linguin = Linguin(self.api_token, raise_on_error=True)
+
+        with self.assertRaises(LinguinRateLimitError):
+            linguin.detect_language('test')
+
+        with self.assertRaises(LinguinInputError):
+            linguin.detect_language(' ')
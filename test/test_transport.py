@@ -0,0 +1,110 @@
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from faker import Faker
+from faker.providers import misc
+from linguin import Linguin
+from linguin import LinguinDeadlineExceededError
+from linguin.benchmark import measure_import
+from linguin.encoding import RequestEncoder
+from linguin.mock_server import MockLinguinServer
+from linguin.retry import RetryBudget, RetryPolicy
+from linguin.transport import AsyncTransport, Transport, TransportResponse, load_transport
+from linguin.transport_urllib import UrllibTransport
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(misc)
+        self.api_token = self.faker.uuid4()
+        self.server = MockLinguinServer(seed=1).start()
+        self.linguin = Linguin(self.api_token, base_uri=self.server.base_uri, transport='urllib')
+
+    def tearDown(self):
+        self.linguin.close()
+        self.server.stop()
+
+    def test_urllib_transport_keeps_connection_alive(self):
+        assert self.linguin.detect_language('고마워요').top_language == 'ko'
+        assert self.linguin.detect_profanity('you moron').result == {'score': 0.99}
+        assert self.linguin.bulk_detect_profanity(['a test', 'idiot']).result == {'scores': [0.01, 0.99]}
+        assert self.linguin.status().is_success == True
+        assert type(self.linguin.transport) is UrllibTransport
+        assert self.server.connections == 1
+
+    def test_urllib_transport_with_encoder(self):
+        linguin = Linguin(self.api_token, base_uri=self.server.base_uri, transport='urllib',
+                          encoder=RequestEncoder(format='json', compression='gzip', compress_threshold=0))
+
+        assert linguin.bulk_detect_language(['สวัสดี', 'test']).top_languages == ['th', 'en']
+        linguin.close()
+
+    def test_urllib_transport_errors_are_retried(self):
+        base_uri = self.server.base_uri
+        self.server.stop()
+        linguin = Linguin(self.api_token, base_uri=base_uri, transport='urllib',
+                          retry=RetryPolicy(max_retries=1, backoff=0, budget=RetryBudget(max_tokens=100)))
+
+        with self.assertRaises(OSError):
+            linguin.detect_language('test')
+
+    def test_urllib_transport_respects_deadline(self):
+        self.server.latency = 0.5
+
+        response = self.linguin.detect_profanity('test', deadline=0.1)
+
+        assert isinstance(response.error, LinguinDeadlineExceededError)
+
+    def test_deadline_bounds_wait_for_connection(self):
+        self.server.latency = 0.5
+
+        for transport in ('requests', 'urllib'):
+            linguin = Linguin(self.api_token, base_uri=self.server.base_uri, transport=transport, pool_size=1)
+            slow = threading.Thread(target=linguin.detect_profanity, args=('slow',))
+            slow.start()
+            time.sleep(0.05)
+
+            started = time.perf_counter()
+            response = linguin.detect_profanity('fast', deadline=0.1)
+
+            assert isinstance(response.error, LinguinDeadlineExceededError)
+            assert time.perf_counter() - started < 0.3
+            slow.join()
+            linguin.close()
+
+    def test_transport_instance(self):
+        transport = UrllibTransport(pool_size=2)
+        linguin = Linguin(self.api_token, base_uri=self.server.base_uri, transport=transport)
+
+        assert linguin.detect_profanity('idiot').result == {'score': 0.99}
+        assert linguin.transport is transport
+        linguin.close()
+
+    def test_unknown_transport(self):
+        with self.assertRaises(ValueError):
+            load_transport('curl')
+
+    def test_response_json(self):
+        assert TransportResponse(200, {}, b'{"a": 1}').json() == {'a': 1}
+
+    def test_import_is_lazy(self):
+        modules = ("requests", "aiohttp", "sqlite3", "concurrent.futures", "logging", "hashlib", "gzip", "json")
+        code = 'import sys, linguin; print(sorted(name for name in {modules} if name in sys.modules))'.format(modules=modules)
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == '[]'
+
+    def test_transports_are_abstract(self):
+        with self.assertRaises(TypeError):
+            Transport()
+
+        with self.assertRaises(TypeError):
+            AsyncTransport()
+
+    def test_measure_import(self):
+        result = measure_import('linguin', 'import linguin', repeat=1)
+
+        assert result['name'] == 'linguin'
+        assert result['seconds'] > 0